@@ -0,0 +1,120 @@
+import threading
+import pygame
+from typing import Dict, Optional, Set, Tuple
+
+
+class AssetManager:
+    """
+    Общий кэш изображений.
+
+    Каждый файл декодируется один раз, а масштабированные варианты хранятся по ключу
+    (путь, размер, прозрачность). Возвращаемые поверхности разделяются между объектами,
+    поэтому изменять их нельзя - для рисования поверх нужно сделать copy().
+    """
+
+    _images: Dict[Tuple[str, Optional[Tuple[int, int]], bool], pygame.Surface] = {}
+    _masks: Dict[int, Optional[pygame.mask.Mask]] = {}  # По id поверхностей из _images
+    _decoded: Dict[str, pygame.Surface] = {}  # Декодированные заранее, но еще не конвертированные изображения
+    _missing: Set[str] = set()  # Файлы, которых не оказалось на диске; повторно не ищутся
+    _pending: Dict[str, threading.Event] = {}  # Файлы, которые сейчас декодируются в фоне
+    _lock = threading.Lock()  # Защищает _decoded и _pending от гонки с фоновыми потоками
+
+    @classmethod
+    def load_image(cls, path: str, size: Optional[Tuple[int, int]] = None, alpha: bool = True) -> pygame.Surface:
+        """
+        Возвращает изображение из кэша, загружая его при первом обращении.
+
+        Args:
+            path: Путь к файлу изображения
+            size: Размер, к которому нужно масштабировать изображение, None - исходный
+            alpha: Сохранять ли прозрачность (convert_alpha вместо convert)
+
+        Raises:
+            FileNotFoundError: Если файл не найден
+        """
+        key = (path, size, alpha)
+        image = cls._images.get(key)
+        if image is None:
+            if size is None:
+                image = cls._take_decoded(path)
+                image = image.convert_alpha() if alpha else image.convert()
+            else:
+                image = pygame.transform.scale(cls.load_image(path, None, alpha), size)
+            cls._images[key] = image
+            cls._masks[id(image)] = None
+        return image
+
+    @classmethod
+    def preload(cls, path: str) -> None:
+        """
+        Декодирует файл заранее, не трогая дисплей, поэтому может вызываться из фонового потока.
+        Конвертация в формат экрана выполняется при первом load_image в основном потоке.
+        """
+        with cls._lock:
+            if cls.is_loaded(path):
+                return
+            done = cls._pending[path] = threading.Event()
+
+        try:
+            image = cls._decode(path)
+            with cls._lock:
+                # Результат не нужен, если основной поток уже успел получить изображение сам
+                if (path, None, True) not in cls._images and (path, None, False) not in cls._images:
+                    cls._decoded[path] = image
+        finally:
+            with cls._lock:
+                del cls._pending[path]
+            done.set()
+
+    @classmethod
+    def is_loaded(cls, path: str) -> bool:
+        """Декодирован ли уже файл (заранее или обычной загрузкой) или известно, что его нет"""
+        return (path in cls._decoded or path in cls._missing or path in cls._pending or
+                (path, None, True) in cls._images or (path, None, False) in cls._images)
+
+    @classmethod
+    def _take_decoded(cls, path: str) -> pygame.Surface:
+        """
+        Забирает поверхность, декодированную заранее, а если ее декодирование еще идет в фоне - дожидается его.
+        Исходная поверхность удаляется из кэша, так как после конвертации больше не нужна.
+        """
+        with cls._lock:
+            done = cls._pending.get(path)
+        if done is not None:
+            done.wait()
+
+        with cls._lock:
+            image = cls._decoded.pop(path, None)
+        if image is None:
+            image = cls._decode(path)
+        return image
+
+    @classmethod
+    def _decode(cls, path: str) -> pygame.Surface:
+        """Читает файл с диска, запоминая отсутствующие, чтобы не искать их при каждом обращении"""
+        if path in cls._missing:
+            raise FileNotFoundError(f"Файл не найден: {path}")
+        try:
+            return pygame.image.load(path)
+        except FileNotFoundError:
+            cls._missing.add(path)
+            raise
+
+    @classmethod
+    def get_mask(cls, image: pygame.Surface) -> pygame.mask.Mask:
+        """Возвращает маску столкновений; для поверхностей из кэша она строится один раз"""
+        if id(image) not in cls._masks:
+            return pygame.mask.from_surface(image)
+
+        mask = cls._masks[id(image)]
+        if mask is None:
+            mask = pygame.mask.from_surface(image)
+            cls._masks[id(image)] = mask
+        return mask
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._images.clear()
+        cls._masks.clear()
+        cls._decoded.clear()
+        cls._missing.clear()
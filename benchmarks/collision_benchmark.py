@@ -0,0 +1,125 @@
+"""
+Стоимость проверки столкновений автобуса за кадр в зависимости от числа статических коллайдеров.
+
+Второй замер ищет точку безубыточности пакетной проверки: автобус окружен кандидатами, чьи AABB
+пересекаются с его AABB, но сами прямоугольники не сталкиваются, поэтому Collider.check_intersections
+проверяет всех кандидатов. По нему выбирается Config.BATCH_COLLISION_THRESHOLD.
+
+Запуск из корня проекта:
+    python -m benchmarks.collision_benchmark
+"""
+import math
+import random
+import timeit
+
+from collider import Collider
+from collision_batch import ColliderArray
+from config import Config
+from spatial_index import SpatialGrid
+
+MAP_WIDTH, MAP_HEIGHT = 4000, 5000
+FRAMES = 200
+CANDIDATE_COUNTS = (4, 8, 16, 24, 32, 48, 64, 128, 256)
+CROSSOVER_REPEATS = 2000
+
+
+def make_static_colliders(count: int) -> list:
+    rng = random.Random(0)
+    return [
+        Collider((rng.uniform(0, MAP_WIDTH), rng.uniform(0, MAP_HEIGHT)), 70, 70, 0)
+        for _ in range(count)
+    ]
+
+
+def make_bus_path() -> list:
+    """Положения и углы коллайдера автобуса для последовательности кадров"""
+    return [
+        ((MAP_WIDTH / 2 + 300 * math.cos(frame / 50), MAP_HEIGHT / 2 + 300 * math.sin(frame / 50)), frame / 50)
+        for frame in range(FRAMES)
+    ]
+
+
+def run_naive(bus: Collider, colliders: list, path: list) -> None:
+    """Полная проверка SAT со всеми коллайдерами, как до добавления широкой фазы"""
+    for center, angle in path:
+        bus.update(center, angle)
+        for collider in colliders:
+            if bus._check_collision_with(collider):
+                break
+
+
+def run_broad_phase(bus: Collider, grid: SpatialGrid, path: list) -> None:
+    for center, angle in path:
+        bus.update(center, angle)
+        min_x, min_y, max_x, max_y = bus.get_aabb()
+        bus.check_intersections(grid.query_bounds(min_x - 10, min_y - 10, max_x + 10, max_y + 10))
+
+
+def run_batch(bus: Collider, colliders: ColliderArray, path: list) -> None:
+    """Проверка со всеми коллайдерами одной векторной операцией"""
+    for center, angle in path:
+        bus.update(center, angle)
+        colliders.overlap_mask(bus).any()
+
+
+def make_near_misses(bus: Collider, count: int) -> list:
+    """Небольшие коллайдеры в углах AABB повернутого автобуса: отсечение по AABB проходят, SAT - нет"""
+    rng = random.Random(count)
+    min_x, min_y, max_x, max_y = bus.get_aabb()
+    colliders = []
+    while len(colliders) < count:
+        collider = Collider((rng.uniform(min_x, max_x), rng.uniform(min_y, max_y)), 6, 6, 0)
+        if not bus._check_collision_with(collider):
+            colliders.append(collider)
+    return colliders
+
+
+def time_check_intersections(bus: Collider, candidates: list, threshold: int) -> float:
+    """Среднее время Collider.check_intersections при заданном пороге пакетной проверки"""
+    original_threshold = Config.BATCH_COLLISION_THRESHOLD
+    Config.BATCH_COLLISION_THRESHOLD = threshold
+    try:
+        return timeit.timeit(lambda: bus.check_intersections(candidates), number=CROSSOVER_REPEATS) / CROSSOVER_REPEATS
+    finally:
+        Config.BATCH_COLLISION_THRESHOLD = original_threshold
+
+
+def measure_batch_crossover() -> None:
+    bus = Collider((0, 0), 40, 110, math.pi / 4)
+    print(f"Кандидаты без столкновения: поочередно против NumPy "
+          f"(BATCH_COLLISION_THRESHOLD = {Config.BATCH_COLLISION_THRESHOLD})")
+    crossover = None
+    for count in CANDIDATE_COUNTS:
+        candidates = make_near_misses(bus, count)
+        scalar = time_check_intersections(bus, candidates, count + 1)
+        batch = time_check_intersections(bus, candidates, 0)
+        if crossover is None and batch < scalar:
+            crossover = count
+        print(f"  {count:>4} кандидатов: поочередно {scalar * 1e6:8.1f} мкс, NumPy {batch * 1e6:8.1f} мкс, "
+              f"ускорение {scalar / batch:5.2f}x")
+    print(f"  NumPy выгоднее начиная с {crossover} кандидатов" if crossover else "  NumPy не выгоднее")
+
+
+def main():
+    path = make_bus_path()
+    print(f"Среднее время проверки столкновений за кадр ({FRAMES} кадров)")
+    for count in (100, 1000, 10000):
+        colliders = make_static_colliders(count)
+        grid = SpatialGrid()
+        for collider in colliders:
+            grid.insert_bounds(collider, *collider.get_aabb())
+        array = ColliderArray.from_colliders(colliders)
+        bus = Collider(path[0][0], 40, 110, 0)
+
+        naive = timeit.timeit(lambda: run_naive(bus, colliders, path), number=1) / FRAMES
+        broad = timeit.timeit(lambda: run_broad_phase(bus, grid, path), number=1) / FRAMES
+        batch = timeit.timeit(lambda: run_batch(bus, array, path), number=1) / FRAMES
+        print(f"  {count:>6} коллайдеров: полный перебор {naive * 1e6:10.1f} мкс, "
+              f"широкая фаза {broad * 1e6:8.1f} мкс, NumPy {batch * 1e6:8.1f} мкс")
+
+    print()
+    measure_batch_crossover()
+
+
+if __name__ == "__main__":
+    main()
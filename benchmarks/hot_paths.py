@@ -0,0 +1,255 @@
+"""
+Микробенчмарки горячих путей игры с разным объемом данных.
+
+Ландшафт и объекты карты генерируются, поэтому карта высот и map.json не нужны; изображения
+берутся из assets, а при их отсутствии объекты используют свои заглушки. Для каждого случая
+печатается число операций в секунду и время одной операции.
+
+Запуск из корня проекта:
+    python -m benchmarks.hot_paths
+    python -m benchmarks.hot_paths --only sorted_objects --max-size 1000
+"""
+import argparse
+import json
+import math
+import os
+import random
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from bus import Bus
+from camera import Camera
+from collider import Collider
+from config import Config
+from dashboard import Dashboard
+from game_map import GameMap
+from game_random import GameRandom
+from input_source import BusControls, ProgrammaticInput
+from transmission import GearState, Transmission
+
+MAP_WIDTH, MAP_HEIGHT = 4000, 5000
+LOOKUPS = 1000  # Вызовов get_elevation за одну операцию
+
+_terrains: Dict[Tuple[int, int], tuple] = {}
+_maps: Dict[Tuple[int, int, int], GameMap] = {}
+
+
+def make_terrain(width: int, height: int) -> tuple:
+    """Гладкий синтетический рельеф в формате результата GameMap.load_terrain, общий для карт одного размера"""
+    if (width, height) in _terrains:
+        return _terrains[width, height]
+    x = np.linspace(0, 8 * np.pi, width, dtype=np.float32)[:, None]
+    y = np.linspace(0, 6 * np.pi, height, dtype=np.float32)[None, :]
+    heightmap = ((np.sin(x) * np.cos(y) + 1) * 30000).astype(np.uint16)
+    max_height = heightmap.max()
+    _terrains[width, height] = (heightmap, max_height, GameMap._normalize_heightmap(heightmap, max_height))
+    return _terrains[width, height]
+
+
+def make_objects(count: int, width: int, height: int) -> List[dict]:
+    rng = random.Random(count)
+    objects = []
+    for i in range(count):
+        x, y = rng.uniform(0, width), rng.uniform(0, height)
+        if i % 50 == 0:
+            objects.append({"type": "stop", "x": x, "y": y, "name": f"Остановка {i}", "capacity": 20})
+        else:
+            objects.append({"type": rng.choice(("tree", "rock")), "x": x, "y": y})
+    return objects
+
+
+def get_game_map(object_count: int = 0, width: int = MAP_WIDTH, height: int = MAP_HEIGHT) -> GameMap:
+    """Карта с заданным числом объектов; одинаковые карты переиспользуются между случаями"""
+    key = (object_count, width, height)
+    if key not in _maps:
+        GameRandom.seed(Config.WORLD_SEED)
+        with tempfile.TemporaryDirectory() as directory:
+            objects_path = os.path.join(directory, "map.json")
+            with open(objects_path, "w", encoding="utf-8") as f:
+                json.dump(make_objects(object_count, width, height), f)
+            _maps[key] = GameMap("", objects_path, make_terrain(width, height))
+    return _maps[key]
+
+
+def camera_positions(count: int = 64) -> List[Camera]:
+    """Камеры в разных точках карты, как при поездке автобуса"""
+    rng = random.Random(1)
+    cameras = []
+    for _ in range(count):
+        camera = Camera(Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT, MAP_WIDTH, MAP_HEIGHT)
+        camera.center_on((rng.randrange(MAP_WIDTH), rng.randrange(MAP_HEIGHT)))
+        cameras.append(camera)
+    return cameras
+
+
+def bench_get_elevation(size: int) -> Tuple[Callable[[], None], int]:
+    game_map = get_game_map(0, size, size)
+    rng = random.Random(2)
+    points = [(rng.uniform(0, size), rng.uniform(0, size)) for _ in range(LOOKUPS)]
+
+    def op():
+        get_elevation = game_map.get_elevation
+        for x, y in points:
+            get_elevation(x, y)
+
+    return op, LOOKUPS
+
+
+def bench_redraw_map(block_size: int) -> Tuple[Callable[[], None], int]:
+    """Полная перерисовка кадра ландшафта с пустым кэшем фрагментов"""
+    game_map = get_game_map()
+    cameras = camera_positions()
+    state = {"frame": 0}
+    original_block_size = Config.TERRAIN_BLOCK_SIZE
+
+    def op():
+        Config.TERRAIN_BLOCK_SIZE = block_size
+        game_map.terrain_cache.clear()
+        game_map._redraw_map(cameras[state["frame"] % len(cameras)])
+        state["frame"] += 1
+        Config.TERRAIN_BLOCK_SIZE = original_block_size
+
+    return op, 1
+
+
+def bench_sorted_objects(object_count: int) -> Tuple[Callable[[], None], int]:
+    game_map = get_game_map(object_count)
+    cameras = camera_positions()
+    state = {"frame": 0}
+
+    def op():
+        game_map.get_sorted_objects(cameras[state["frame"] % len(cameras)].camera_rect)
+        state["frame"] += 1
+
+    return op, 1
+
+
+def bench_check_intersections(collider_count: int) -> Tuple[Callable[[], None], int]:
+    """Проверка автобуса против списка кандидатов, сгруппированных вокруг него"""
+    rng = random.Random(3)
+    bus_collider = Collider((0, 0), 40, 110, 0)
+    # Автобус ездит по кольцу радиусом 300, свободному от препятствий, поэтому проверка
+    # не завершается досрочно на первом столкновении
+    colliders = []
+    while len(colliders) < collider_count:
+        x, y = rng.uniform(-600, 600), rng.uniform(-600, 600)
+        if abs(math.hypot(x, y) - 300) > 130:
+            colliders.append(Collider((x, y), 70, 70, 0))
+    path = [((300 * math.cos(i / 10), 300 * math.sin(i / 10)), i / 10) for i in range(64)]
+    state = {"frame": 0}
+
+    def op():
+        center, angle = path[state["frame"] % len(path)]
+        bus_collider.update(center, angle)
+        bus_collider.check_intersections(colliders)
+        state["frame"] += 1
+
+    return op, 1
+
+
+def bench_bus_update(object_count: int) -> Tuple[Callable[[], None], int]:
+    """Шаг автобуса с широкой фазой столкновений, как в GameScreen.update"""
+    game_map = get_game_map(object_count)
+    bus = Bus(MAP_WIDTH // 2, MAP_HEIGHT // 2, ProgrammaticInput(BusControls(up=True, left=True)))
+
+    def op():
+        bus.update(game_map.width, game_map.height, game_map)
+
+    return op, 1
+
+
+def bench_transmission_update(_: int) -> Tuple[Callable[[], None], int]:
+    """Цикл разгона с переключением передач"""
+    transmission = Transmission()
+    pattern = [(1.0, 0.0, None)] * 30 + [(0.0, 1.0, GearState.SECOND)] * 5 + [(0.5, 0.0, None)] * 30 + \
+              [(0.0, 1.0, GearState.FIRST)] * 5
+    state = {"frame": 0}
+
+    def op():
+        throttle, clutch, gear = pattern[state["frame"] % len(pattern)]
+        transmission.update(throttle, clutch, gear)
+        state["frame"] += 1
+
+    return op, 1
+
+
+def bench_dashboard_draw(_: int) -> Tuple[Callable[[], None], int]:
+    """Отрисовка панели при плавно меняющейся скорости, топливе и курсе"""
+    bus = Bus(MAP_WIDTH // 2, MAP_HEIGHT // 2, ProgrammaticInput())
+    dashboard = Dashboard(bus)
+    surface = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+    state = {"frame": 0}
+
+    def op():
+        frame = state["frame"]
+        bus.speed = 5 * math.sin(frame / 100)
+        bus.fuel = 100 - (frame / 100) % 100
+        bus.angle = frame % 360
+        dashboard.draw(surface)
+        state["frame"] += 1
+
+    return op, 1
+
+
+# Название, размеры данных и фабрика, возвращающая (операция, число единиц работы в ней)
+BENCHMARKS = [
+    ("get_elevation", "сторона карты", [1000, 4000], bench_get_elevation),
+    ("redraw_map", "блок, px", [10, 1], bench_redraw_map),
+    ("sorted_objects", "объектов", [10, 1000, 100000], bench_sorted_objects),
+    ("check_intersections", "коллайдеров", [10, 100, 1000], bench_check_intersections),
+    ("bus_update", "объектов", [10, 1000, 100000], bench_bus_update),
+    ("transmission_update", "-", [1], bench_transmission_update),
+    ("dashboard_draw", "-", [1], bench_dashboard_draw),
+]
+
+
+def measure(op: Callable[[], None], min_time: float) -> Tuple[int, float]:
+    """Вызывает операцию пачками, пока не наберется min_time секунд; возвращает (вызовы, секунды)"""
+    op()  # Прогрев кэшей
+    calls = 0
+    batch = 1
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        for _ in range(batch):
+            op()
+        calls += batch
+        batch *= 2
+        elapsed = time.perf_counter() - start
+    return calls, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Микробенчмарки горячих путей")
+    parser.add_argument("--only", help="Запускать только случаи, в названии которых есть эта строка")
+    parser.add_argument("--max-size", type=int, help="Пропускать размеры данных больше этого")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Минимальное время замера, с")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+
+    print(f"{'случай':<22}{'размер':>22}{'операций/с':>16}{'мкс/операцию':>16}")
+    for name, size_label, sizes, factory in BENCHMARKS:
+        if args.only and args.only not in name:
+            continue
+        for size in sizes:
+            if args.max_size is not None and size > args.max_size:
+                continue
+            op, units = factory(size)
+            calls, elapsed = measure(op, args.min_time)
+            ops_per_second = calls * units / elapsed
+            size_text = "" if size_label == "-" else f"{size} ({size_label})"
+            print(f"{name:<22}{size_text:>22}{ops_per_second:>16,.0f}{1e6 / ops_per_second:>16.2f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Сравнение отрисовки ландшафта: исходный цикл с pygame.draw.rect против векторной раскраски.
+
+Запуск из корня проекта:
+    python -m benchmarks.terrain_benchmark
+"""
+import os
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from terrain import render_heightmap
+
+WIDTH, HEIGHT = 800, 600
+REPEATS = 20
+
+
+def render_loop(heightmap: np.ndarray, max_height: float, block_size: int) -> pygame.Surface:
+    """Исходная реализация GameMap._redraw_map: вызов get_elevation и draw.rect на каждый блок"""
+    map_width, map_height = heightmap.shape
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    for x in range(0, WIDTH, block_size):
+        for y in range(0, HEIGHT, block_size):
+            height = heightmap[int(max(0, min(x, map_width - 1))), int(max(0, min(y, map_height - 1)))] / max_height
+            color = (int(240 * height), int(230 * height), int(140 * height))
+            pygame.draw.rect(surface, color, (x, y, block_size, block_size))
+    return surface
+
+
+def render_vectorized(elevation: np.ndarray, block_size: int) -> pygame.Surface:
+    """Текущая реализация: раскраска высот, нормированных один раз при загрузке карты"""
+    return render_heightmap(elevation[:WIDTH, :HEIGHT], block_size)
+
+
+def main():
+    pygame.init()
+    heightmap = np.random.default_rng(0).integers(0, 65535, (WIDTH * 2, HEIGHT * 2), dtype=np.uint16)
+    max_height = heightmap.max()
+    elevation = heightmap.astype(np.float32) / np.float32(max_height)
+
+    print(f"Область {WIDTH}x{HEIGHT}, среднее по {REPEATS} запускам")
+    for block_size in (10, 1):
+        for name, render in (("цикл", lambda: render_loop(heightmap, max_height, block_size)),
+                             ("numpy", lambda: render_vectorized(elevation, block_size))):
+            seconds = timeit.timeit(render, number=REPEATS) / REPEATS
+            print(f"  блок {block_size:>2}px, {name:<6}: {seconds * 1000:8.2f} мс")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
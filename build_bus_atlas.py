@@ -0,0 +1,50 @@
+"""
+Сборка атласа спрайтов автобуса: все кадры поворота упаковываются в одно изображение и индекс.
+
+Прозрачные поля кадров обрезаются одинаково и симметрично относительно центра кадра,
+поэтому центр автобуса в спрайте не смещается, а декодировать нужно вдвое меньше пикселей.
+
+Использование:
+    python build_bus_atlas.py
+"""
+import json
+import math
+import pygame
+
+FRAMES_COUNT = 48
+FRAME_PATH = "assets/yellow_bus/Yellow_BUS_CLEAN_All_{:03d}.png"
+ATLAS_IMAGE_PATH = "assets/yellow_bus/atlas.png"
+ATLAS_INDEX_PATH = "assets/yellow_bus/atlas.json"
+COLUMNS = 8
+
+
+def get_trim_rect(frames: list) -> pygame.Rect:
+    """Общая для всех кадров область без прозрачных полей, симметричная относительно центра"""
+    bounds = frames[0].get_bounding_rect().unionall([frame.get_bounding_rect() for frame in frames[1:]])
+    width, height = frames[0].get_size()
+    half_width = max(width // 2 - bounds.left, bounds.right - width // 2)
+    half_height = max(height // 2 - bounds.top, bounds.bottom - height // 2)
+    return pygame.Rect(width // 2 - half_width, height // 2 - half_height, half_width * 2, half_height * 2)
+
+
+def build_atlas() -> None:
+    frames = [pygame.image.load(FRAME_PATH.format(i)) for i in range(FRAMES_COUNT)]
+    trim = get_trim_rect(frames)
+    rows = math.ceil(FRAMES_COUNT / COLUMNS)
+
+    atlas = pygame.Surface((trim.width * COLUMNS, trim.height * rows), pygame.SRCALPHA)
+    rects = []
+    for i, frame in enumerate(frames):
+        x = (i % COLUMNS) * trim.width
+        y = (i // COLUMNS) * trim.height
+        atlas.blit(frame, (x, y), trim)
+        rects.append([x, y, trim.width, trim.height])
+
+    pygame.image.save(atlas, ATLAS_IMAGE_PATH)
+    with open(ATLAS_INDEX_PATH, "w", encoding="utf-8") as f:
+        json.dump({"image": ATLAS_IMAGE_PATH, "frames": rects}, f)
+    print(f"{FRAMES_COUNT} кадров -> {ATLAS_IMAGE_PATH} ({atlas.get_width()}x{atlas.get_height()}), {ATLAS_INDEX_PATH}")
+
+
+if __name__ == "__main__":
+    build_atlas()
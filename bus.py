@@ -1,49 +1,76 @@
+import json
 import math
+import numpy as np
 import pygame
+from asset_manager import AssetManager
 from config import Config
-from typing import List
+from typing import List, Optional
 from collider import Collider
+from input_source import InputSource, KeyboardInput
 
 
 class Bus(pygame.sprite.Sprite):
-    def __init__(self, x: float, y: float):
+    # Расстояния от центра до точек замера высоты вдоль курса: передние (дальняя, ближняя), задние (дальняя, ближняя)
+    PROBE_DISTANCES = np.array([55, 45, -55, -25])
+
+    def __init__(self, x: float, y: float, input_source: Optional[InputSource] = None):
         super().__init__()
+        self.input_source = input_source if input_source is not None else KeyboardInput()
         self.z_order = 1
+        self.max_speed = 5
+        self.deceleration = 0.05
+        self.max_fuel = 100
+        self.rotation_speed = 2
+        self.capacity = 30
+        self.sprites = self._load_sprites()
+        self.collider = Collider((x, y), 40, 110, 0)
+        self.reset(x, y)
+
+    def reset(self, x: float, y: float) -> None:
+        """Сбрасывает состояние автобуса для нового заезда, сохраняя загруженные спрайты"""
         self.base_y = y
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.angle = 0
         self.speed = 0
-        self.max_speed = 5
         self.acceleration = 0.1
-        self.deceleration = 0.05
-        self.fuel = 100
-        self.max_fuel = 100
-        self.rotation_speed = 2
-        self.sprites = self._load_sprites()
+        self.fuel = self.max_fuel
         self.current_sprite = 36
         self.condition = 100
         self.score = 0
-        self.capacity = 30
         self.passengers = 0
         self.image = self.sprites[self.current_sprite]
         self.rect = self.image.get_rect(center=(self.x, self.y))
-        self.collider = Collider((x, y), 40, 110, 0)
+        self.collider.update((x, y), 0)
+        self.input_source.reset()
 
     def _load_sprites(self) -> list[pygame.Surface]:
+        # Атлас (см. build_bus_atlas.py) декодируется одним файлом, кадры ссылаются на его пиксели
+        try:
+            return self._load_atlas_sprites()
+        except FileNotFoundError:
+            pass
+
         sprites = []
         for i in range(48):
             sprite_num = f"{i:03d}"
             try:
-                img = pygame.image.load(
-                    f"assets/yellow_bus/Yellow_BUS_CLEAN_All_{sprite_num}.png"
-                ).convert_alpha()
+                img = AssetManager.load_image(f"assets/yellow_bus/Yellow_BUS_CLEAN_All_{sprite_num}.png")
                 sprites.append(img)
             except FileNotFoundError:
                 print(f"Не удалось загрузить спрайт bus_{sprite_num}.png")
                 sprites.append(self._create_dummy_sprite())
         return sprites
 
+    @staticmethod
+    def _load_atlas_sprites() -> list[pygame.Surface]:
+        with open("assets/yellow_bus/atlas.json", "r", encoding="utf-8") as f:
+            index = json.load(f)
+        atlas = AssetManager.load_image(index["image"])
+        return [atlas.subsurface(pygame.Rect(rect)) for rect in index["frames"]]
+
     @staticmethod
     def _create_dummy_sprite() -> pygame.Surface:
         dummy_surf = pygame.Surface((40, 80), pygame.SRCALPHA)
@@ -51,7 +78,15 @@ class Bus(pygame.sprite.Sprite):
         pygame.draw.rect(dummy_surf, Config.BLUE, (5, 10, 30, 20))
         return dummy_surf
 
-    def update(self, map_width: int, map_height: int, game_map, colliders: List[Collider]) -> None:
+    def update(self, map_width: int, map_height: int, game_map,
+               colliders: Optional[List[Collider]] = None) -> None:
+        """
+        Args:
+            colliders: Статические коллайдеры для проверки, None - запросить у карты ближайшие
+                к положению после перемещения
+        """
+        self.prev_x = self.x
+        self.prev_y = self.y
         self._handle_input()
         self._update_speed(game_map)
         if self.fuel == 0:
@@ -63,6 +98,11 @@ class Bus(pygame.sprite.Sprite):
         self._update_position(map_width, map_height)
         self.collider.update((self.x, self.y), math.radians(-self.angle))
 
+        # Широкая фаза по уже сдвинутому и повернутому коллайдеру не требует запаса на скорость,
+        # которая из-за уклона может превышать max_speed
+        if colliders is None:
+            colliders = game_map.get_colliders_near(self.collider)
+
         if self.collider.check_intersections(colliders):
             self.x = old_x
             self.y = old_y
@@ -76,11 +116,11 @@ class Bus(pygame.sprite.Sprite):
         self.base_y = self.y
 
     def _handle_input(self) -> None:
-        keys = pygame.key.get_pressed()
+        controls = self.input_source.read()
 
-        if keys[pygame.K_UP] and self.speed < self.max_speed:
+        if controls.up and self.speed < self.max_speed:
             self.speed += self.acceleration
-        elif keys[pygame.K_DOWN] and self.speed > -self.max_speed / 2:
+        elif controls.down and self.speed > -self.max_speed / 2:
             self.speed -= self.acceleration
         else:
             if self.speed > 0:
@@ -89,9 +129,9 @@ class Bus(pygame.sprite.Sprite):
                 self.speed = min(0.0, self.speed + self.deceleration)
 
         if self.speed:
-            if keys[pygame.K_LEFT]:
+            if controls.left:
                 self.angle += self.rotation_speed * (abs(self.speed) / self.max_speed)
-            if keys[pygame.K_RIGHT]:
+            if controls.right:
                 self.angle -= self.rotation_speed * (abs(self.speed) / self.max_speed)
 
         self.angle %= 360
@@ -100,28 +140,18 @@ class Bus(pygame.sprite.Sprite):
         rad_angle = math.radians(self.angle)
         slope = self._calculate_slope(game_map)
 
-        front_height_diff = game_map.get_elevation(
-            self.x - 55 * math.sin(rad_angle),
-            self.y - 55 * math.cos(rad_angle)
-        ) - game_map.get_elevation(
-            self.x - 45 * math.sin(rad_angle),
-            self.y - 45 * math.cos(rad_angle)
-        )
-
-        rear_height_diff = game_map.get_elevation(
-            self.x + 55 * math.sin(rad_angle),
-            self.y + 55 * math.cos(rad_angle)
-        ) - game_map.get_elevation(
-            self.x + 25 * math.sin(rad_angle),
-            self.y + 25 * math.cos(rad_angle)
+        front_far, front_near, rear_far, rear_near = game_map.get_elevations(
+            self.x - self.PROBE_DISTANCES * math.sin(rad_angle),
+            self.y - self.PROBE_DISTANCES * math.cos(rad_angle)
         )
+        front_height_diff = front_far - front_near
+        rear_height_diff = rear_far - rear_near
 
         if front_height_diff > 0.3 and self.speed > 0:
             self.speed = 0
         elif rear_height_diff > 0.3 and self.speed < 0:
             self.speed = 0
-        elif game_map.get_elevation(self.x + 25 * math.sin(rad_angle), self.y + 25 * math.cos(rad_angle)) > \
-                game_map.get_elevation(self.x - 45 * math.sin(rad_angle), self.y - 45 * math.cos(rad_angle)):
+        elif rear_near > front_near:
             self.speed += 0.5 * slope
         else:
             self.speed -= 0.5 * slope
@@ -142,9 +172,15 @@ class Bus(pygame.sprite.Sprite):
         self.image = self.sprites[self.current_sprite]
         self.rect = self.image.get_rect(center=(self.x, self.y))
 
+    def get_render_rect(self, interpolation: float) -> pygame.Rect:
+        """Прямоугольник спрайта в точке между предыдущим и текущим шагом симуляции"""
+        return self.image.get_rect(center=(
+            self.prev_x + (self.x - self.prev_x) * interpolation,
+            self.prev_y + (self.y - self.prev_y) * interpolation
+        ))
+
     def _calculate_slope(self, game_map) -> float:
-        dx = game_map.get_elevation(self.x + 25, self.y) - game_map.get_elevation(self.x - 45, self.y)
-        dy = game_map.get_elevation(self.x, self.y + 25) - game_map.get_elevation(self.x, self.y - 45)
+        dx, dy = game_map.get_slope(self.x, self.y)
         return math.sqrt(dx * dx + dy * dy)
 
     def draw_debug(self, surface: pygame.Surface, camera) -> None:
@@ -13,8 +13,11 @@ class Camera:
         return entity.rect.move(self.camera_rect.x, self.camera_rect.y)
 
     def update(self, target: pygame.sprite.Sprite) -> None:
-        x = -target.rect.centerx + self.width // 2
-        y = -target.rect.centery + self.height // 2
+        self.center_on(target.rect.center)
+
+    def center_on(self, center: tuple) -> None:
+        x = -center[0] + self.width // 2
+        y = -center[1] + self.height // 2
 
         # Ограничение камеры границами карты
         x = min(0, x)
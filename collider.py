@@ -1,22 +1,60 @@
 import math
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+from collision_batch import ColliderArray
+from config import Config
 
 
 class Collider:
+    # Вершины, оси, проекции и AABB кэшируются и пересчитываются только после update,
+    # поэтому неподвижные коллайдеры не тратят время на тригонометрию каждый кадр
+    __slots__ = ('center', 'width', 'height', 'angle',
+                 '_vertices', '_axes', '_own_projections', '_aabb')
+
     def __init__(self, center: Tuple[float, float], width: int, height: int, angle: float):
         self.center = center
         self.width = width
         self.height = height
         self.angle = angle  # В радианах
+        self._invalidate()
 
     def update(self, center: Tuple[float, float], angle: float) -> None:
+        if center == self.center and angle == self.angle:
+            return
         self.center = center
         self.angle = angle
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._vertices: Optional[List[List[float]]] = None
+        self._axes: Optional[List[List[float]]] = None
+        self._own_projections: Optional[List[Tuple[float, float]]] = None
+        self._aabb: Optional[Tuple[float, float, float, float]] = None
+
+    def get_aabb(self) -> Tuple[float, float, float, float]:
+        """Возвращает ограничивающий прямоугольник, выровненный по осям: (min_x, min_y, max_x, max_y)"""
+        if self._aabb is None:
+            xs = [x for x, _ in self.get_vertices()]
+            ys = [y for _, y in self.get_vertices()]
+            self._aabb = (min(xs), min(ys), max(xs), max(ys))
+        return self._aabb
 
     def check_intersections(self, colliders: List['Collider']) -> bool:
+        # Дешевое отсечение по AABB перед полной проверкой SAT
+        min_x, min_y, max_x, max_y = self.get_aabb()
+        candidates = []
         for collider in colliders:
             if collider is self:
                 continue
+            other_min_x, other_min_y, other_max_x, other_max_y = collider.get_aabb()
+            if max_x < other_min_x or other_max_x < min_x or max_y < other_min_y or other_max_y < min_y:
+                continue
+            candidates.append(collider)
+
+        # Много пересекающихся AABB (скопление тел) выгоднее проверить одной векторной операцией
+        if len(candidates) >= Config.BATCH_COLLISION_THRESHOLD:
+            return bool(ColliderArray.from_colliders(candidates).overlap_mask(self).any())
+
+        for collider in candidates:
             if self._check_collision_with(collider):
                 return True
         return False
@@ -25,41 +63,61 @@ class Collider:
         vertices_self = self.get_vertices()
         vertices_other = other.get_vertices()
 
-        axes = self._get_axes() + other._get_axes()
+        # Проекции каждого коллайдера на собственные оси берутся из кэша
+        for axis, (min_self, max_self) in zip(self._get_axes(), self._get_own_projections()):
+            min_other, max_other = self._project(vertices_other, axis)
+            if max_self < min_other or max_other < min_self:
+                return False
 
-        for axis in axes:
+        # При одинаковом угле оси второго коллайдера совпадают с уже проверенными
+        if other.angle == self.angle:
+            return True
+
+        for axis, (min_other, max_other) in zip(other._get_axes(), other._get_own_projections()):
             min_self, max_self = self._project(vertices_self, axis)
-            min_other, max_other = self._project(vertices_other, axis)
             if max_self < min_other or max_other < min_self:
                 return False
         return True
 
     def get_vertices(self) -> List[List[float]]:
-        half_w = self.width / 2
-        half_h = self.height / 2
-        corners = [
-            (half_w, half_h),
-            (-half_w, half_h),
-            (-half_w, -half_h),
-            (half_w, -half_h)
-        ]
-        cos_a = math.cos(self.angle)
-        sin_a = math.sin(self.angle)
-        cx, cy = self.center
-        vertices = []
-        for x, y in corners:
-            rot_x = x * cos_a - y * sin_a
-            rot_y = x * sin_a + y * cos_a
-            vertices.append([cx + rot_x, cy + rot_y])
-        return vertices
+        """Возвращает вершины в мировых координатах (общий кэшированный список, не изменять)"""
+        if self._vertices is None:
+            half_w = self.width / 2
+            half_h = self.height / 2
+            corners = [
+                (half_w, half_h),
+                (-half_w, half_h),
+                (-half_w, -half_h),
+                (half_w, -half_h)
+            ]
+            (cos_a, sin_a), _ = self._get_axes()
+            cx, cy = self.center
+            vertices = []
+            for x, y in corners:
+                rot_x = x * cos_a - y * sin_a
+                rot_y = x * sin_a + y * cos_a
+                vertices.append([cx + rot_x, cy + rot_y])
+            self._vertices = vertices
+        return self._vertices
 
     def _get_axes(self) -> List[List[float]]:
-        return [
-            [math.cos(self.angle), math.sin(self.angle)],
-            [-math.sin(self.angle), math.cos(self.angle)]
-        ]
+        if self._axes is None:
+            cos_a = math.cos(self.angle)
+            sin_a = math.sin(self.angle)
+            self._axes = [
+                [cos_a, sin_a],
+                [-sin_a, cos_a]
+            ]
+        return self._axes
+
+    def _get_own_projections(self) -> List[Tuple[float, float]]:
+        if self._own_projections is None:
+            vertices = self.get_vertices()
+            self._own_projections = [self._project(vertices, axis) for axis in self._get_axes()]
+        return self._own_projections
 
-    def _project(self, vertices: List[List[float]], axis: List[float]) -> tuple:
+    @staticmethod
+    def _project(vertices: List[List[float]], axis: List[float]) -> tuple:
         min_proj = float('inf')
         max_proj = -float('inf')
         for x, y in vertices:
@@ -0,0 +1,82 @@
+import numpy as np
+from typing import Sequence
+
+
+class ColliderArray:
+    """
+    Набор ориентированных прямоугольников в виде массивов NumPy для пакетной проверки SAT.
+
+    Семантика совпадает с Collider._check_collision_with: касание считается пересечением.
+    """
+
+    def __init__(self, centers: np.ndarray, half_sizes: np.ndarray, angles: np.ndarray):
+        """
+        Args:
+            centers: Центры в формате (N, 2)
+            half_sizes: Половины ширины и высоты в формате (N, 2)
+            angles: Углы поворота в радианах, формат (N,)
+        """
+        self.centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+        self.half_sizes = np.asarray(half_sizes, dtype=np.float64).reshape(-1, 2)
+        self.angles = np.asarray(angles, dtype=np.float64).reshape(-1)
+        # Оси каждого прямоугольника: u = (cos, sin), v = (-sin, cos)
+        self.cos = np.cos(self.angles)
+        self.sin = np.sin(self.angles)
+
+    @classmethod
+    def from_colliders(cls, colliders: Sequence) -> 'ColliderArray':
+        return cls(
+            [collider.center for collider in colliders],
+            [(collider.width / 2, collider.height / 2) for collider in colliders],
+            [collider.angle for collider in colliders]
+        )
+
+    def __len__(self) -> int:
+        return len(self.angles)
+
+    def overlap_mask(self, collider) -> np.ndarray:
+        """Возвращает булеву маску прямоугольников набора, пересекающихся с коллайдером"""
+        cos_a = np.cos(collider.angle)
+        sin_a = np.sin(collider.angle)
+        return self._overlaps(
+            np.array(collider.center, dtype=np.float64),
+            np.array((collider.width / 2, collider.height / 2), dtype=np.float64),
+            cos_a, sin_a,
+            self.centers, self.half_sizes, self.cos, self.sin
+        )
+
+    def pairwise_overlaps(self) -> np.ndarray:
+        """Возвращает матрицу (N, N) попарных пересечений; диагональ равна False"""
+        mask = self._overlaps(
+            self.centers[:, np.newaxis], self.half_sizes[:, np.newaxis],
+            self.cos[:, np.newaxis], self.sin[:, np.newaxis],
+            self.centers[np.newaxis], self.half_sizes[np.newaxis],
+            self.cos[np.newaxis], self.sin[np.newaxis]
+        )
+        np.fill_diagonal(mask, False)
+        return mask
+
+    @staticmethod
+    def _overlaps(center_a, half_a, cos_a, sin_a, center_b, half_b, cos_b, sin_b) -> np.ndarray:
+        """
+        Теорема о разделяющей оси для двух групп прямоугольников с поддержкой broadcasting.
+
+        Для каждой из четырех осей прямоугольники разделены, если расстояние между центрами
+        в проекции больше суммы проекций их половинных размеров.
+        """
+        delta = center_b - center_a
+        dx, dy = delta[..., 0], delta[..., 1]
+        hw_a, hh_a = half_a[..., 0], half_a[..., 1]
+        hw_b, hh_b = half_b[..., 0], half_b[..., 1]
+
+        # Косинусы углов между осями A и B
+        uu = np.abs(cos_a * cos_b + sin_a * sin_b)
+        uv = np.abs(sin_b * cos_a - cos_b * sin_a)
+
+        # Оси A: u_a = (cos_a, sin_a), v_a = (-sin_a, cos_a)
+        separated = np.abs(dx * cos_a + dy * sin_a) > hw_a + hw_b * uu + hh_b * uv
+        separated |= np.abs(-dx * sin_a + dy * cos_a) > hh_a + hw_b * uv + hh_b * uu
+        # Оси B
+        separated |= np.abs(dx * cos_b + dy * sin_b) > hw_b + hw_a * uu + hh_a * uv
+        separated |= np.abs(-dx * sin_b + dy * cos_b) > hh_b + hw_a * uv + hh_a * uu
+        return ~separated
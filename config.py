@@ -15,7 +15,34 @@ class Config:
     MAGENTA = (255, 0, 255)
     SCREEN_WIDTH = 800
     SCREEN_HEIGHT = 600
-    FPS = 60
+    FPS = 60  # Частота отрисовки
+    # Частота шагов симуляции. Физика автобуса настроена на шаг 1/60 с, поэтому частоту отрисовки
+    # можно менять независимо, а эту - нет
+    SIMULATION_RATE = 60
+    MAX_FRAME_TIME = 0.25  # Секунд; после более долгого кадра симуляция не догоняет отставание
+    WORLD_SEED = 0  # Зерно для случайных параметров мира (размеры деревьев), одинаковых в каждом запуске
+    FONT_NAME = 'Monospace Regular'
+
+    # Ландшафт
+    TERRAIN_BLOCK_SIZE = 10  # Размер блока одного цвета, 1 - полное разрешение
+    TERRAIN_CHUNK_SIZE = 250  # Должен быть кратен размеру блока ландшафта
+    TERRAIN_CACHE_BUDGET = 64 * 1024 * 1024  # Байт
+    TERRAIN_INCREMENTAL_SCROLL = True  # Сдвигать кадр при движении камеры вместо полной перерисовки
+
+    # Пространственный индекс объектов карты
+    SPATIAL_CELL_SIZE = 256
+
+    # Начиная с этого числа кандидатов, прошедших отсечение по AABB, SAT выполняется пакетно через NumPy.
+    # По benchmarks/collision_benchmark.py пакетная проверка окупается с 16-24 кандидатов; порог взят с запасом
+    BATCH_COLLISION_THRESHOLD = 32
+
+    # Количество отрисованных строк интерфейса, хранимых в кэше
+    TEXT_CACHE_SIZE = 512
+    # Количество разбитых на строки и отрисованных абзацев (сюжет, события)
+    TEXT_LAYOUT_CACHE_SIZE = 64
+
+    # Сколько следующих слайдов сюжета декодируется заранее в фоне
+    STORY_PRELOAD_SLIDES = 2
 
     # TODO: реализовать чтение конфига из json-файла, для этого нужно переделать логику использования конфига в
     #  остальном коде с атрибутов класса на атрибуты экземпляра, создаваемого в инициализации мэйна
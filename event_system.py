@@ -1,6 +1,8 @@
 import pygame
 from typing import List, Dict, Optional, Callable
 from config import Config
+from fonts import FontRegistry
+from text_cache import TextCache
 from bus import Bus
 from game_object import Stop
 import math
@@ -15,7 +17,7 @@ class GameEvent:
         self.elapsed = 0
         self.completed = False
         self.callback: Optional[Callable] = None
-        self.font = pygame.font.SysFont('Monospace Regular', 24)
+        self.font = FontRegistry.get(24)
 
     def start(self, callback: Optional[Callable] = None):
         """Начинает выполнение события"""
@@ -94,12 +96,12 @@ class PassengerBoardingEvent(GameEvent):
         pygame.draw.rect(surface, Config.GREEN, (bar_x, bar_y, fill_width, bar_height))
 
         # Текст
-        text = self.font.render(f"Посадка пассажиров: {self.stop.name}", True, Config.WHITE)
+        text = TextCache.render(self.font, f"Посадка пассажиров: {self.stop.name}", Config.WHITE)
         text_rect = text.get_rect(center=(Config.SCREEN_WIDTH // 2, bar_y - 20))
         surface.blit(text, text_rect)
 
         # Количество пассажиров
-        count_text = self.font.render(f"{int(self.progress * self.passengers)}/{self.passengers}", True, Config.WHITE)
+        count_text = TextCache.render(self.font, f"{int(self.progress * self.passengers)}/{self.passengers}", Config.WHITE)
         count_rect = count_text.get_rect(center=(Config.SCREEN_WIDTH // 2, bar_y + bar_height // 2))
         surface.blit(count_text, count_rect)
 
@@ -142,7 +144,7 @@ class PassengerDisboardingEvent(GameEvent):
         pygame.draw.rect(surface, Config.GREEN, (bar_x, bar_y, fill_width, bar_height))
 
         # Текст
-        text = self.font.render(f"Высадка пассажиров: {self.stop.name}", True, Config.WHITE)
+        text = TextCache.render(self.font, f"Высадка пассажиров: {self.stop.name}", Config.WHITE)
         text_rect = text.get_rect(center=(Config.SCREEN_WIDTH // 2, bar_y - 20))
         surface.blit(text, text_rect)
 
@@ -184,11 +186,11 @@ class OnRouteEvent(GameEvent):
                 self.callback()
 
     def draw(self, surface: pygame.Surface):
-        text = self.font.render(f"Оставшееся время: {int((self.duration - self.elapsed) // 60)}:{int((self.duration - self.elapsed) % 60)}", True, Config.WHITE)
+        text = TextCache.render(self.font, f"Оставшееся время: {int((self.duration - self.elapsed) // 60)}:{int((self.duration - self.elapsed) % 60)}", Config.WHITE)
         text_rect = text.get_rect(center=(110, Config.SCREEN_HEIGHT - 30))
         surface.blit(text, text_rect)
 
-        text = self.font.render(f"Цель: {self.target_stop.name}", True, Config.WHITE)
+        text = TextCache.render(self.font, f"Цель: {self.target_stop.name}", Config.WHITE)
         text_rect = text.get_rect(center=(350, Config.SCREEN_HEIGHT - 30))
         surface.blit(text, text_rect)
 
@@ -209,7 +211,7 @@ class OnRouteEvent(GameEvent):
         end_y = compass_rect.centery + (compass_size // 2 - 5) * math.sin(angle_rad)
         pygame.draw.line(surface, Config.RED, compass_rect.center, (end_x, end_y), 2)
 
-        text = self.font.render(f"{int(self.distance/10)} м", True, Config.YELLOW)
+        text = TextCache.render(self.font, f"{int(self.distance/10)} м", Config.YELLOW)
         text_rect = text.get_rect(center=(510, Config.SCREEN_HEIGHT - 30))
         surface.blit(text, text_rect)
 
@@ -219,7 +221,7 @@ class EventSystem:
 
     def __init__(self):
         self.active_events: List[GameEvent] = []
-        self.font = pygame.font.SysFont('Monospace Regular', 24)
+        self.font = FontRegistry.get(24)
 
     def has_active_event(self):
         """Проверяет наличие активных событий"""
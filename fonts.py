@@ -0,0 +1,27 @@
+import pygame
+from typing import Dict, Tuple
+from config import Config
+
+
+class FontRegistry:
+    """
+    Общий реестр шрифтов.
+
+    Поиск системного шрифта (SysFont) медленный, поэтому каждый шрифт создается один раз
+    по ключу (имя, размер) и затем разделяется всеми экранами, событиями и панелями.
+    """
+
+    _fonts: Dict[Tuple[str, int], pygame.font.Font] = {}
+
+    @classmethod
+    def get(cls, size: int, name: str = Config.FONT_NAME) -> pygame.font.Font:
+        key = (name, size)
+        font = cls._fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(name, size)
+            cls._fonts[key] = font
+        return font
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._fonts.clear()
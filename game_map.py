@@ -1,20 +1,42 @@
 import json
+from operator import attrgetter
 import numpy as np
 import pygame
 from PIL import Image
-from typing import Optional, List
+from typing import Callable, Optional, List, Tuple
+from collider import Collider
 from config import Config
 from game_object import GameObject, Stop
+from spatial_index import SpatialGrid
+from terrain import TerrainChunkCache, render_heightmap
 
 
 class GameMap:
-    def __init__(self, path: str, objects_path: Optional[str] = None):
-        self.heightmap = self._load_heightmap(path)
-        self.max_height = self.heightmap.max()
+    # Смещения точек, по разности высот в которых оценивается уклон (колесная база автобуса)
+    SLOPE_AHEAD = 25
+    SLOPE_BEHIND = 45
+
+    # Количество шагов load_terrain, о которых сообщается через progress
+    TERRAIN_LOAD_STEPS = 2
+
+    def __init__(self, path: str, objects_path: Optional[str] = None, terrain: Optional[tuple] = None):
+        """
+        Args:
+            path: Путь к карте высот
+            objects_path: Путь к описанию объектов карты
+            terrain: Результат load_terrain, если ландшафт уже загружен (например, в фоне)
+        """
+        if terrain is None:
+            terrain = self.load_terrain(path)
+        self.heightmap, self.max_height, self.elevation = terrain
         self.objects: List[GameObject] = []
+        self.object_index = SpatialGrid()
+        self.collider_index = SpatialGrid()
         self.width, self.height = self.heightmap.shape
         self.last_camera_pos = (Config.SCREEN_WIDTH / 2, Config.SCREEN_HEIGHT / 2)
         self.cached_surface = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+        self.cached_surface_valid = False
+        self.terrain_cache = TerrainChunkCache(self._render_terrain, self.width, self.height)
         if objects_path:
             self._load_objects_from_json(objects_path)
 
@@ -38,6 +60,24 @@ class GameMap:
                     z_order=obj.get('z_order', 0)
                 )
             self.objects.append(game_object)
+            self.object_index.insert(game_object, game_object.rect)
+            if hasattr(game_object, 'collider'):
+                self.collider_index.insert_bounds(game_object.collider, *game_object.collider.get_aabb())
+
+        # Статические объекты сортируются один раз, видимое подмножество упорядочивается по готовому индексу
+        self.objects.sort(key=lambda o: (o.z_order, o.base_y))
+        for draw_order, game_object in enumerate(self.objects):
+            game_object.draw_order = draw_order
+
+    def reset(self) -> None:
+        """Сбрасывает изменяемое состояние объектов карты, не перезагружая ландшафт и спрайты"""
+        for obj in self.objects:
+            obj.reset()
+
+    def get_colliders_near(self, collider: Collider, margin: float = 0) -> List[Collider]:
+        """Возвращает статические коллайдеры из ячеек, пересекающих AABB коллайдера, расширенный на margin"""
+        min_x, min_y, max_x, max_y = collider.get_aabb()
+        return self.collider_index.query_bounds(min_x - margin, min_y - margin, max_x + margin, max_y + margin)
 
     def get_sorted_objects(self, camera_rect: pygame.Rect) -> List[GameObject]:
         visible_area = pygame.Rect(
@@ -47,46 +87,139 @@ class GameMap:
             camera_rect.height
         )
         visible = [
-            obj for obj in self.objects
+            obj for obj in self.object_index.query(visible_area)
             if visible_area.colliderect(obj.rect)
         ]
-        visible.sort(key=lambda o: (o.z_order, o.base_y))
+        visible.sort(key=attrgetter('draw_order'))
         return visible
 
+    @classmethod
+    def load_terrain(cls, path: str, progress: Optional[Callable[[], None]] = None) -> tuple:
+        """
+        Загружает карту высот и переводит ее в нормированные высоты. Не использует pygame,
+        поэтому может выполняться в фоновом потоке.
+
+        Args:
+            path: Путь к карте высот
+            progress: Вызывается после каждого из TERRAIN_LOAD_STEPS шагов
+
+        Returns:
+            tuple: (heightmap, max_height, elevation)
+        """
+        heightmap = cls._load_heightmap(path)
+        max_height = heightmap.max()
+        if progress:
+            progress()
+        elevation = cls._normalize_heightmap(heightmap, max_height)
+        if progress:
+            progress()
+        return heightmap, max_height, elevation
+
     @staticmethod
     def _load_heightmap(path: str) -> np.ndarray:
+        # Несжатая карта отображается в память: страницы читаются по мере обращения
+        # и разделяются между процессами через кэш ОС
+        if path.endswith('.npy'):
+            return np.load(path, mmap_mode='r')
         return np.load(path)['arr_0']
 
+    @staticmethod
+    def _normalize_heightmap(heightmap: np.ndarray, max_height: float) -> np.ndarray:
+        """Переводит карту высот в диапазон [0, 1] один раз при загрузке"""
+        return heightmap.astype(np.float32) / np.float32(max_height)
+
     def get_elevation(self, x: float, y: float) -> float:
-        return self.heightmap[int(max(0, min(x, self.width-1))), int(max(0, min(y, self.height-1)))] / self.max_height
+        return self.elevation[int(max(0, min(x, self.width-1))), int(max(0, min(y, self.height-1)))]
+
+    def get_elevations(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Возвращает высоты сразу для массива точек с тем же ограничением координат, что и get_elevation"""
+        ix = np.clip(xs, 0, self.width - 1).astype(np.intp)
+        iy = np.clip(ys, 0, self.height - 1).astype(np.intp)
+        return self.elevation[ix, iy]
+
+    def get_slope(self, x: float, y: float) -> Tuple[float, float]:
+        """Возвращает уклон (dx, dy) в точке - разности высот по осям между точками SLOPE_AHEAD и SLOPE_BEHIND"""
+        ix = int(max(0, min(x, self.width - 1)))
+        iy = int(max(0, min(y, self.height - 1)))
+        elevation = self.elevation
+        dx = elevation[min(ix + self.SLOPE_AHEAD, self.width - 1), iy] - elevation[max(ix - self.SLOPE_BEHIND, 0), iy]
+        dy = elevation[ix, min(iy + self.SLOPE_AHEAD, self.height - 1)] - elevation[ix, max(iy - self.SLOPE_BEHIND, 0)]
+        return dx, dy
+
+    def sample_elevation(self, x: float, y: float) -> float:
+        """Возвращает высоту в точке с билинейной интерполяцией между соседними пикселями"""
+        x = max(0.0, min(x, self.width - 1))
+        y = max(0.0, min(y, self.height - 1))
+        x0, y0 = int(x), int(y)
+        x1 = min(x0 + 1, self.width - 1)
+        y1 = min(y0 + 1, self.height - 1)
+        fx, fy = x - x0, y - y0
+
+        elevation = self.elevation
+        top = elevation[x0, y0] + (elevation[x1, y0] - elevation[x0, y0]) * fx
+        bottom = elevation[x0, y1] + (elevation[x1, y1] - elevation[x0, y1]) * fx
+        return top + (bottom - top) * fy
 
     def draw(self, surface: pygame.Surface, camera) -> None:
         if self._should_redraw(camera):
-            self._redraw_map(camera)
+            if Config.TERRAIN_INCREMENTAL_SCROLL and self._can_scroll(camera):
+                self._scroll_map(camera)
+            else:
+                self._redraw_map(camera)
 
         surface.blit(self.cached_surface, (0, 0))
 
     def _should_redraw(self, camera) -> bool:
         return (abs(camera.camera_rect.x - self.last_camera_pos[0]) > 0 or
                 abs(camera.camera_rect.y - self.last_camera_pos[1]) > 0 or
-                self.cached_surface is None)
+                not self.cached_surface_valid)
+
+    def _can_scroll(self, camera) -> bool:
+        """Проверяет, что часть закэшированного кадра остается видимой после сдвига камеры"""
+        return (self.cached_surface_valid and
+                abs(camera.camera_rect.x - self.last_camera_pos[0]) < Config.SCREEN_WIDTH and
+                abs(camera.camera_rect.y - self.last_camera_pos[1]) < Config.SCREEN_HEIGHT)
 
     def _redraw_map(self, camera) -> None:
         self.last_camera_pos = (camera.camera_rect.x, camera.camera_rect.y)
-        self.cached_surface.fill(Config.BLACK)
-
-        start_x = max(0, -camera.camera_rect.x // 10 * 10)
-        end_x = min(self.width, start_x + Config.SCREEN_WIDTH + 10)
-
-        start_y = max(0, -camera.camera_rect.y // 10 * 10)
-        end_y = min(self.height, start_y + Config.SCREEN_HEIGHT + 10)
-
-        for x in range(int(start_x), int(end_x), 10):
-            for y in range(int(start_y), int(end_y), 10):
-                height = self.get_elevation(x, y)
-                color = (int(240 * height), int(230 * height), int(140 * height))
-                pygame.draw.rect(
-                    self.cached_surface,
-                    color,
-                    (x + camera.camera_rect.x, y + camera.camera_rect.y, 10, 10)
-                )
+        self._draw_terrain_area(pygame.Rect(0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT), camera)
+        self.cached_surface_valid = True
+
+    def _scroll_map(self, camera) -> None:
+        """Сдвигает закэшированный кадр на смещение камеры и дорисовывает только открывшиеся полосы"""
+        dx = int(camera.camera_rect.x - self.last_camera_pos[0])
+        dy = int(camera.camera_rect.y - self.last_camera_pos[1])
+        self.last_camera_pos = (camera.camera_rect.x, camera.camera_rect.y)
+        self.cached_surface.scroll(dx, dy)
+
+        # Вертикальная полоса на всю высоту экрана
+        if dx > 0:
+            self._draw_terrain_area(pygame.Rect(0, 0, dx, Config.SCREEN_HEIGHT), camera)
+        elif dx < 0:
+            self._draw_terrain_area(
+                pygame.Rect(Config.SCREEN_WIDTH + dx, 0, -dx, Config.SCREEN_HEIGHT), camera)
+
+        # Горизонтальная полоса без уже перерисованного угла
+        strip_x = max(0, dx)
+        strip_width = Config.SCREEN_WIDTH - abs(dx)
+        if dy > 0:
+            self._draw_terrain_area(pygame.Rect(strip_x, 0, strip_width, dy), camera)
+        elif dy < 0:
+            self._draw_terrain_area(
+                pygame.Rect(strip_x, Config.SCREEN_HEIGHT + dy, strip_width, -dy), camera)
+
+    def _draw_terrain_area(self, screen_area: pygame.Rect, camera) -> None:
+        """Перерисовывает в закэшированном кадре прямоугольник экрана"""
+        self.cached_surface.fill(Config.BLACK, screen_area)
+        self.terrain_cache.draw(
+            self.cached_surface,
+            screen_area.move(-camera.camera_rect.x, -camera.camera_rect.y),
+            (camera.camera_rect.x, camera.camera_rect.y)
+        )
+
+    def _render_terrain(self, area: pygame.Rect) -> pygame.Surface:
+        """Отрисовывает область карты блоками Config.TERRAIN_BLOCK_SIZE в отдельную поверхность"""
+        return render_heightmap(
+            self.elevation[area.left:area.right, area.top:area.bottom],
+            Config.TERRAIN_BLOCK_SIZE
+        )
@@ -1,6 +1,7 @@
 import pygame
+from asset_manager import AssetManager
 from config import Config
-from random import randint
+from game_random import GameRandom
 from collider import Collider
 from bus import Bus
 
@@ -10,6 +11,7 @@ class GameObject(pygame.sprite.Sprite):
         super().__init__()
         self.type = obj_type
         self.z_order = z_order
+        self.draw_order = 0  # Позиция в отсортированном порядке отрисовки, назначается картой
         self._load_sprite()
         match obj_type:
             case "rock":
@@ -17,21 +19,27 @@ class GameObject(pygame.sprite.Sprite):
             case "tree":
                 self.collider = Collider((x, y+45), 22, 20, 0)
         self.rect = self.image.get_rect(center=(x, y))
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = AssetManager.get_mask(self.image)
         self.base_y = y
 
+    def reset(self) -> None:
+        """Сбрасывает изменяемое состояние объекта перед новой игрой"""
+        pass
+
     def _load_sprite(self):
-        self.sprites = {
-            'tree': self._load_image('assets/objects/tree.png', (70, 150+randint(-10, 10))),
-            'rock': self._load_image('assets/objects/rock.png', (70, 70)),
-        }
-        self.image = self.sprites.get(self.type, self._create_dummy_sprite())
+        # Загружается только спрайт своего типа, поверхности разделяются между объектами через AssetManager
+        match self.type:
+            case "tree":
+                self.image = self._load_image('assets/objects/tree.png', (70, 150+GameRandom.randint(-10, 10)))
+            case "rock":
+                self.image = self._load_image('assets/objects/rock.png', (70, 70))
+            case _:
+                self.image = self._create_dummy_sprite()
 
     @staticmethod
     def _load_image(path: str, size: tuple) -> pygame.Surface:
         try:
-            img = pygame.image.load(path).convert_alpha()
-            return pygame.transform.scale(img, size)
+            return AssetManager.load_image(path, size)
         except FileNotFoundError:
             return GameObject._create_dummy_sprite(size)
 
@@ -48,22 +56,25 @@ class Stop(GameObject):
         super().__init__(x, y, "stop", z_order=1)
         self.name = name
         self.capacity = capacity
-        self.passengers = randint(5, capacity)
         self.collider = Collider((x, y), 80, 80, 0)
-        self.active = True
-        self.waiting_time = 0
-        self.spawn_timer = 0
+        self.reset()
 
         # Загрузка специального спрайта
         try:
-            self.image = pygame.image.load('assets/objects/bus_stop.png').convert_alpha()
-            self.image = pygame.transform.scale(self.image, (80, 80))
+            self.image = AssetManager.load_image('assets/objects/bus_stop.png', (80, 80))
         except:
             self.image = self._create_dummy_sprite((80, 80))
             pygame.draw.circle(self.image, Config.YELLOW, (40, 40), 30)
 
         self.rect = self.image.get_rect(center=(x, y))
 
+    def reset(self) -> None:
+        """Восстанавливает пассажиров и таймеры остановки"""
+        self.passengers = GameRandom.randint(5, self.capacity)
+        self.active = True
+        self.waiting_time = 0
+        self.spawn_timer = 0
+
     def update(self, dt: float):
         """Обновление состояния остановки"""
         if not self.active:
@@ -75,7 +86,7 @@ class Stop(GameObject):
 
             self.spawn_timer = 0
             if self.passengers < self.capacity:
-                self.passengers = min(self.capacity, self.passengers + randint(1, 3))
+                self.passengers = min(self.capacity, self.passengers + GameRandom.randint(1, 3))
 
     def interact(self, bus: 'Bus') -> int:
         """Взаимодействие с автобусом, возвращает количество принятых пассажиров"""
@@ -0,0 +1,25 @@
+import random
+
+
+class GameRandom:
+    """
+    Общий генератор случайных чисел игры.
+
+    Все случайные решения (пассажиры на остановках, размеры деревьев, цели рейсов, перегрев двигателя)
+    берутся из одного генератора, поэтому заезд с тем же зерном и тем же управлением повторяется точно.
+    """
+
+    _random = random.Random()
+
+    @classmethod
+    def seed(cls, value: int) -> None:
+        cls._random.seed(value)
+
+    @classmethod
+    def randint(cls, a: int, b: int) -> int:
+        return cls._random.randint(a, b)
+
+    @classmethod
+    def new_seed(cls) -> int:
+        """Случайное зерно для нового заезда, не зависящее от состояния генератора игры"""
+        return random.SystemRandom().randrange(2 ** 32)
@@ -0,0 +1,77 @@
+"""
+Симуляция заезда без окна и без ограничения частоты кадров - для нагрузочных и регрессионных прогонов.
+
+Каждый тик выполняет то же обновление, что и игровой экран (события, автобус, остановки),
+но ничего не отрисовывает и не ждет Clock.tick.
+
+Использование:
+    python headless.py --ticks 10000
+    python headless.py --ticks 10000 --script drive.json
+"""
+import argparse
+import os
+import time
+from typing import Optional
+from config import Config
+from game_state import GameState
+from input_source import BusControls, InputSource, ScriptedInput
+
+
+class HeadlessRunner:
+    """Игра без отображения: мир и экран игры создаются как обычно, но только обновляются"""
+
+    def __init__(self, input_source: Optional[InputSource] = None, dt: float = 1 / Config.SIMULATION_RATE,
+                 seed: Optional[int] = None):
+        # Видеодрайвер выбирается при инициализации pygame, поэтому задается до создания игры
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        from main import Game
+
+        self.game = Game(input_source, seed)
+        self.game.change_state(GameState.GAME)
+        self.game_screen = self.game.current_screen
+        self.dt = dt
+
+    @property
+    def ticks(self) -> int:
+        return self.game.ticks
+
+    @property
+    def bus(self):
+        return self.game.bus
+
+    def step(self) -> None:
+        self.game_screen.update(self.dt)
+        self.game.ticks += 1
+
+    def run(self, ticks: int) -> float:
+        """Выполняет заданное число тиков и возвращает затраченное время в секундах"""
+        start = time.perf_counter()
+        for _ in range(ticks):
+            self.step()
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Симуляция заезда без окна")
+    parser.add_argument("--ticks", type=int, default=10000, help="Число тиков симуляции")
+    parser.add_argument("--script", help="JSON-сценарий управления для ScriptedInput")
+    parser.add_argument("--seed", type=int, help="Зерно случайности заезда")
+    args = parser.parse_args()
+
+    if args.script:
+        input_source = ScriptedInput.from_file(args.script)
+    else:
+        # По умолчанию автобус едет по кругу
+        input_source = ScriptedInput([(1, BusControls(up=True, left=True))], loop=True)
+
+    runner = HeadlessRunner(input_source, seed=args.seed)
+    elapsed = runner.run(args.ticks)
+    bus = runner.bus
+    print(f"{args.ticks} тиков за {elapsed:.2f} с ({args.ticks / elapsed:.0f} тиков/с)")
+    print(f"Автобус: x={bus.x:.1f} y={bus.y:.1f} угол={bus.angle:.1f} скорость={bus.speed:.2f} "
+          f"топливо={bus.fuel:.1f} пассажиры={bus.passengers} очки={bus.score}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Конвертер карты высот в несжатый формат .npy, который игра открывает через mmap без распаковки.
+
+Использование:
+    python heightmap_converter.py assets/heightmap.npz assets/heightmap.npy
+    python heightmap_converter.py assets/heightmap.png assets/heightmap.npy
+"""
+import argparse
+import numpy as np
+from PIL import Image
+
+
+def load_source(path: str) -> np.ndarray:
+    """Загружает карту высот в формате (ширина, высота) из .npz или изображения"""
+    if path.endswith(".npz"):
+        return np.load(path)['arr_0']
+    if path.endswith(".npy"):
+        return np.load(path)
+
+    # Изображение хранится построчно (высота, ширина), а игра индексирует карту как [x, y]
+    image = np.asarray(Image.open(path).convert("I")).astype(np.uint16)
+    return image.T
+
+
+def convert(source: str, destination: str) -> None:
+    heightmap = np.ascontiguousarray(load_source(source))
+    np.save(destination, heightmap)
+    print(f"{source} -> {destination}: {heightmap.shape[0]}x{heightmap.shape[1]}, {heightmap.dtype}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Конвертация карты высот в .npy для отображения в память")
+    parser.add_argument("source", help="Исходная карта высот (.npz, .npy или изображение)")
+    parser.add_argument("destination", help="Путь к результирующему .npy файлу")
+    args = parser.parse_args()
+    convert(args.source, args.destination)
+
+
+if __name__ == "__main__":
+    main()
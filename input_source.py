@@ -0,0 +1,93 @@
+import json
+from abc import ABC, abstractmethod
+import pygame
+from typing import List, NamedTuple, Sequence, Tuple
+
+
+class BusControls(NamedTuple):
+    """Состояние органов управления автобусом на один тик"""
+    up: bool = False  # Газ
+    down: bool = False  # Тормоз / задний ход
+    left: bool = False
+    right: bool = False
+
+    @classmethod
+    def from_names(cls, names: Sequence[str]) -> 'BusControls':
+        """Собирает управление из списка нажатых кнопок, например ["up", "left"]"""
+        return cls(**{name: True for name in names})
+
+    def to_names(self) -> List[str]:
+        return [name for name in self._fields if getattr(self, name)]
+
+
+class InputSource(ABC):
+    """Источник управления автобусом, опрашивается один раз за тик симуляции"""
+
+    @abstractmethod
+    def read(self) -> BusControls:
+        pass
+
+    def reset(self) -> None:
+        pass
+
+
+class KeyboardInput(InputSource):
+    """Управление стрелками клавиатуры"""
+
+    def read(self) -> BusControls:
+        keys = pygame.key.get_pressed()
+        return BusControls(keys[pygame.K_UP], keys[pygame.K_DOWN], keys[pygame.K_LEFT], keys[pygame.K_RIGHT])
+
+
+class ProgrammaticInput(InputSource):
+    """Управление, которое выставляет внешний код (тесты, боты) перед каждым тиком"""
+
+    def __init__(self, controls: BusControls = BusControls()):
+        self.controls = controls
+
+    def set(self, **buttons: bool) -> None:
+        """Меняет только переданные кнопки, например set(up=True)"""
+        self.controls = self.controls._replace(**buttons)
+
+    def read(self) -> BusControls:
+        return self.controls
+
+
+class ScriptedInput(InputSource):
+    """
+    Заранее заданный сценарий: список шагов (число тиков, управление).
+    После окончания сценария все кнопки отпущены, если не задано зацикливание.
+    """
+
+    def __init__(self, steps: List[Tuple[int, BusControls]], loop: bool = False):
+        self.steps = steps
+        self.loop = loop
+        self.reset()
+
+    @classmethod
+    def from_file(cls, path: str, loop: bool = False) -> 'ScriptedInput':
+        """Загружает сценарий из JSON вида [[120, ["up"]], [30, ["up", "left"]], [60, []]]"""
+        with open(path, "r", encoding="utf-8") as f:
+            steps = json.load(f)
+        return cls([(ticks, BusControls.from_names(names)) for ticks, names in steps], loop)
+
+    def reset(self) -> None:
+        self.step_index = 0
+        self.step_tick = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.step_index >= len(self.steps)
+
+    def read(self) -> BusControls:
+        while not self.finished and self.step_tick >= self.steps[self.step_index][0]:
+            self.step_index += 1
+            self.step_tick = 0
+            if self.finished and self.loop and any(ticks > 0 for ticks, _ in self.steps):
+                self.step_index = 0
+
+        if self.finished:
+            return BusControls()
+
+        self.step_tick += 1
+        return self.steps[self.step_index][1]
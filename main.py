@@ -1,9 +1,14 @@
+import os
 import pygame
 from game_state import GameState
 from config import Config
+from fonts import FontRegistry
 from game_map import GameMap
+from game_random import GameRandom
 from typing import Optional
 from bus import Bus
+from input_source import InputSource
+from preloader import WorldPreloader
 from screens.main_menu_screen import MainMenuScreen
 from screens.settings_screen import SettingsScreen
 from screens.game_screen import GameScreen
@@ -14,18 +19,23 @@ from screens.story_screen import StoryScreen
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, input_source: Optional[InputSource] = None, seed: Optional[int] = None):
         pygame.init()
         self.screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
         pygame.display.set_caption("Икарус-235")
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont('Monospace Regular', 30)
+        self.font = FontRegistry.get(30)
         self.assets = {}
         self.last_frame = None
         self.story_file = None
 
         self.game_map: Optional[GameMap] = None
         self.bus: Optional[Bus] = None
+        self.input_source = input_source  # None - управление с клавиатуры
+        self.seed = seed  # Зерно каждого заезда, None - новое случайное зерно
+        self.run_seed: Optional[int] = None
+        self.ticks = 0  # Шаги симуляции текущего заезда
+        self.preloader: Optional[WorldPreloader] = None
 
         self.state_handlers = {
             GameState.MAIN_MENU: MainMenuScreen,
@@ -45,10 +55,65 @@ class Game:
         self.change_state(GameState.MAIN_MENU)
 
     def reset_game(self):
-        self.game_map = GameMap("assets/heightmap.npz", "map.json")
-        self.bus = Bus(self.game_map.width // 2, self.game_map.height // 2)
+        # Неизменяемые данные мира (ландшафт, кэши, спрайты) загружаются один раз,
+        # при перезапуске сбрасывается только состояние заезда
+        if self.game_map is None:
+            GameRandom.seed(Config.WORLD_SEED)
+            self.game_map = GameMap(self._heightmap_path(), "map.json", self._wait_for_preloader())
+
+        # Случайность заезда зависит только от его зерна, а не от того, что было до него
+        self.run_seed = self.seed if self.seed is not None else GameRandom.new_seed()
+        GameRandom.seed(self.run_seed)
+        self.ticks = 0
+        self.game_map.reset()
+
+        start_x, start_y = self.game_map.width // 2, self.game_map.height // 2
+        if self.bus is None:
+            self.bus = Bus(start_x, start_y, self.input_source)
+        else:
+            self.bus.reset(start_x, start_y)
+
         if GameState.GAME in self.screens:
-            self.screens[GameState.GAME] = self.state_handlers[GameState.GAME](self)
+            self.screens[GameState.GAME].reset()
+
+    @staticmethod
+    def _heightmap_path() -> str:
+        """Предпочитает несжатую карту высот, открываемую через mmap (см. heightmap_converter.py)"""
+        if os.path.exists("assets/heightmap.npy"):
+            return "assets/heightmap.npy"
+        return "assets/heightmap.npz"
+
+    def _start_preloading(self) -> None:
+        """Запускает фоновую загрузку мира, если он еще не загружен"""
+        if self.game_map is None and self.preloader is None:
+            self.preloader = WorldPreloader(self._heightmap_path())
+            self.preloader.start()
+
+    def _wait_for_preloader(self) -> Optional[tuple]:
+        """Дожидается фоновой загрузки, показывая прогресс; возвращает ландшафт или None без предзагрузки"""
+        if self.preloader is None:
+            return None
+
+        while not self.preloader.done:
+            pygame.event.pump()
+            self._draw_loading(self.preloader.progress)
+            self.clock.tick(Config.FPS)
+
+        terrain = self.preloader.result()
+        self.preloader = None
+        return terrain
+
+    def _draw_loading(self, progress: float) -> None:
+        self.screen.fill(Config.BLACK)
+        text = self.font.render("Загрузка...", True, Config.WHITE)
+        self.screen.blit(text, text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2 - 40)))
+
+        bar_rect = pygame.Rect(0, 0, 300, 20)
+        bar_rect.center = (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2)
+        pygame.draw.rect(self.screen, Config.GRAY, bar_rect, 2)
+        pygame.draw.rect(self.screen, Config.GREEN,
+                         (bar_rect.x, bar_rect.y, int(bar_rect.width * progress), bar_rect.height))
+        pygame.display.flip()
 
     def change_state(self, new_state: GameState, **kwargs) -> None:
         if self.current_screen:
@@ -63,6 +128,8 @@ class Game:
 
         if new_state == GameState.STORY:
             self.story_file = kwargs.get('story_file', 'story.json')
+            # Пока игрок читает сюжет, мир загружается в фоне
+            self._start_preloading()
 
         self.current_state = new_state
 
@@ -78,24 +145,53 @@ class Game:
             self.current_screen.on_enter(story_file=self.story_file)
         else:
             self.current_screen.on_enter(**kwargs)
+        self.current_screen.invalidate()
 
-    def run(self) -> None:
+    def _present(self, screen) -> None:
+        """Отрисовывает экран и выводит на дисплей только изменившиеся области"""
+        if screen.redraw_every_frame:
+            screen.render()
+            screen.pop_dirty_rects()
+            pygame.display.flip()
+        elif screen.dirty_rects:
+            screen.render()
+            pygame.display.update(screen.pop_dirty_rects())
+        # Если статичный экран не изменился, кадр не выводится вовсе
+
+    def run(self, max_ticks: Optional[int] = None) -> None:
+        """
+        Главный цикл игры.
+
+        Args:
+            max_ticks: Завершить игру после этого числа шагов симуляции заезда (для воспроизведения записей)
+        """
         self.running = True
+        # Симуляция идет фиксированными шагами независимо от частоты отрисовки
+        step = 1 / Config.SIMULATION_RATE
+        accumulator = 0.0
         while self.running:
-            dt = self.clock.tick(Config.FPS) / 1000.0
+            accumulator += min(self.clock.tick(Config.FPS) / 1000.0, Config.MAX_FRAME_TIME)
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.running = False
                 if self.current_screen:
+                    # Окно было перекрыто или свернуто: статичный экран нужно вывести заново целиком
+                    if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE, pygame.WINDOWRESTORED):
+                        self.current_screen.invalidate()
                     self.current_screen.handle_events(event)
 
             if self.current_screen:
                 if self.current_screen != GameState.PAUSE:
-                    self.current_screen.update(dt)
-                self.current_screen.render()
-
-            pygame.display.flip()
+                    while accumulator >= step and self.running:
+                        self.current_screen.update(step)
+                        accumulator -= step
+                        if self.current_state == GameState.GAME:
+                            self.ticks += 1
+                            if self.ticks == max_ticks:
+                                self.running = False
+                    self.current_screen.interpolation = accumulator / step
+                self._present(self.current_screen)
 
         pygame.quit()
 
@@ -183,6 +183,8 @@ def generate_random_heightmap(width: int, height: int):
     plt.show()
 
     np.savez_compressed("assets/heightmap.npz", heightmap)
+    # Несжатая копия для открытия через mmap
+    np.save("assets/heightmap.npy", heightmap)
 
 
 generate_random_heightmap(width=4000, height=5000)
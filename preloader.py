@@ -0,0 +1,84 @@
+import threading
+from typing import List, Optional
+from asset_manager import AssetManager
+from game_map import GameMap
+
+# Изображения мира, которые можно декодировать заранее
+WORLD_IMAGES = [
+    "assets/yellow_bus/atlas.png",
+    "assets/objects/tree.png",
+    "assets/objects/rock.png",
+    "assets/objects/bus_stop.png",
+    "assets/dashboard/speedometer.png",
+    "assets/dashboard/fuel.png",
+    "assets/dashboard/engine.png",
+]
+
+
+class WorldPreloader:
+    """Фоновая загрузка ландшафта и декодирование изображений, пока игрок читает сюжет"""
+
+    def __init__(self, heightmap_path: str, image_paths: Optional[List[str]] = None):
+        self.heightmap_path = heightmap_path
+        self.image_paths = WORLD_IMAGES if image_paths is None else image_paths
+        self.total_steps = GameMap.TERRAIN_LOAD_STEPS + len(self.image_paths)
+        self.completed_steps = 0
+        self.terrain: Optional[tuple] = None
+        self.error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="world-preloader", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    @property
+    def done(self) -> bool:
+        return not self._thread.is_alive()
+
+    @property
+    def progress(self) -> float:
+        """Доля выполненной работы от 0 до 1"""
+        return self.completed_steps / self.total_steps
+
+    def result(self) -> tuple:
+        """Дожидается окончания загрузки и возвращает ландшафт для GameMap"""
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+        return self.terrain
+
+    def _run(self) -> None:
+        try:
+            self.terrain = GameMap.load_terrain(self.heightmap_path, self._step)
+            for path in self.image_paths:
+                try:
+                    AssetManager.preload(path)
+                except FileNotFoundError:
+                    pass  # Отсутствующий файл заменится заглушкой при обычной загрузке
+                self._step()
+        except BaseException as e:
+            self.error = e
+
+    def _step(self) -> None:
+        self.completed_steps += 1
+
+
+class ImagePreloader:
+    """Фоновое декодирование списка изображений, например следующих слайдов сюжета"""
+
+    def __init__(self, image_paths: List[str]):
+        self.image_paths = [path for path in image_paths if not AssetManager.is_loaded(path)]
+        self._thread = threading.Thread(target=self._run, name="image-preloader", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    @property
+    def done(self) -> bool:
+        return not self._thread.is_alive()
+
+    def _run(self) -> None:
+        for path in self.image_paths:
+            try:
+                AssetManager.preload(path)
+            except FileNotFoundError:
+                pass  # Отсутствующий файл заменится заглушкой при обычной загрузке
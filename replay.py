@@ -0,0 +1,148 @@
+"""
+Запись и воспроизведение заездов.
+
+Запись хранит зерно случайности заезда и управление автобусом на каждый шаг симуляции.
+Шаг фиксированный (Config.SIMULATION_RATE), поэтому воспроизведение - в окне или без него -
+повторяет заезд точно, что проверяется сравнением итогового состояния с сохраненным.
+
+Прочие клавиши игрового экрана (пауза, отладка) на симуляцию не влияют: на паузе шаги не выполняются.
+
+Использование:
+    python replay.py record drive.json [--seed 42]
+    python replay.py play drive.json [--headless]
+"""
+import argparse
+import json
+from typing import List, Optional
+from config import Config
+from input_source import BusControls, InputSource, KeyboardInput, ScriptedInput
+
+
+class Recording:
+    """Зерно, управление в виде шагов [число тиков, кнопки] и итоговое состояние заезда"""
+
+    def __init__(self, seed: int, steps: List[list], final_state: Optional[list] = None,
+                 simulation_rate: int = Config.SIMULATION_RATE):
+        self.seed = seed
+        self.steps = steps
+        self.final_state = final_state
+        self.simulation_rate = simulation_rate
+
+    @property
+    def ticks(self) -> int:
+        return sum(ticks for ticks, _ in self.steps)
+
+    def to_input(self) -> ScriptedInput:
+        return ScriptedInput([(ticks, BusControls.from_names(names)) for ticks, names in self.steps])
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "seed": self.seed,
+                "simulation_rate": self.simulation_rate,
+                "steps": self.steps,
+                "final_state": self.final_state,
+            }, f)
+
+    @classmethod
+    def load(cls, path: str) -> 'Recording':
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["seed"], data["steps"], data.get("final_state"), data["simulation_rate"])
+
+
+class InputRecorder(InputSource):
+    """Пропускает управление другого источника, запоминая его на каждом тике"""
+
+    def __init__(self, source: InputSource):
+        self.source = source
+        self.steps: List[list] = []
+
+    def read(self) -> BusControls:
+        controls = self.source.read()
+        names = controls.to_names()
+        if self.steps and self.steps[-1][1] == names:
+            self.steps[-1][0] += 1
+        else:
+            self.steps.append([1, names])
+        return controls
+
+    def reset(self) -> None:
+        # Автобус сбрасывается в начале каждого заезда, и запись начинается заново
+        self.source.reset()
+        self.steps = []
+
+
+def get_simulation_state(game) -> list:
+    """Состояние заезда, которое должно совпасть при воспроизведении"""
+    bus = game.bus
+    stops = [obj.passengers for obj in game.game_map.objects if hasattr(obj, "passengers")]
+    return [bus.x, bus.y, bus.angle, bus.speed, bus.fuel, bus.condition, bus.score, bus.passengers, stops]
+
+
+def record(path: str, seed: Optional[int]) -> None:
+    from main import Game
+
+    recorder = InputRecorder(KeyboardInput())
+    game = Game(recorder, seed)
+    game.run()
+    if game.bus is None:
+        print("Заезд не начинался, запись не сохранена")
+        return
+
+    recording = Recording(game.run_seed, recorder.steps, get_simulation_state(game))
+    recording.save(path)
+    print(f"Записано {recording.ticks} тиков, зерно {recording.seed}: {path}")
+
+
+def play(path: str, headless: bool) -> bool:
+    """Воспроизводит запись и возвращает, совпало ли итоговое состояние с записанным"""
+    recording = Recording.load(path)
+    if recording.simulation_rate != Config.SIMULATION_RATE:
+        raise ValueError(f"Запись сделана с частотой симуляции {recording.simulation_rate}, "
+                         f"а сейчас {Config.SIMULATION_RATE}")
+
+    if headless:
+        from headless import HeadlessRunner
+
+        runner = HeadlessRunner(recording.to_input(), seed=recording.seed)
+        runner.run(recording.ticks)
+        game = runner.game
+    else:
+        from main import Game
+        from game_state import GameState
+
+        game = Game(recording.to_input(), recording.seed)
+        game.change_state(GameState.GAME)
+        game.run(max_ticks=recording.ticks)
+
+    if game.ticks < recording.ticks:
+        print(f"Воспроизведение прервано на тике {game.ticks} из {recording.ticks}")
+        return False
+
+    matches = get_simulation_state(game) == recording.final_state
+    print(f"Воспроизведено {recording.ticks} тиков: итоговое состояние {'совпадает' if matches else 'расходится'}")
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Запись и воспроизведение заездов")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Играть с клавиатуры и сохранить последний заезд")
+    record_parser.add_argument("path")
+    record_parser.add_argument("--seed", type=int, help="Зерно случайности заезда")
+
+    play_parser = subparsers.add_parser("play", help="Воспроизвести запись")
+    play_parser.add_argument("path")
+    play_parser.add_argument("--headless", action="store_true", help="Без окна и без ограничения FPS")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args.path, args.seed)
+    elif not play(args.path, args.headless):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,40 @@
 import pygame
+from typing import List, Optional
 from game_state import GameState
+from config import Config
 
 
 class BaseScreen:
+    # Экраны с постоянно меняющимся содержимым перерисовываются каждый кадр. Статичные экраны
+    # выставляют False и сообщают об изменившихся областях через invalidate
+    redraw_every_frame = True
+    # Высота строки вертикального меню, строки отсчитываются от середины экрана
+    menu_row_pitch = 50
+
     def __init__(self, game):
         self.game = game
         self.screen = game.screen
         self.font = game.font
         self.assets = game.assets
+        self.dirty_rects: List[pygame.Rect] = []
+        # Доля шага симуляции, прошедшая после последнего update, для плавной отрисовки между шагами
+        self.interpolation = 1.0
+
+    def invalidate(self, rect: Optional[pygame.Rect] = None) -> None:
+        """Помечает область экрана (по умолчанию весь экран) как требующую перерисовки"""
+        self.dirty_rects.append(pygame.Rect(rect) if rect else self.screen.get_rect())
+
+    def _select_menu_row(self, old_index: int, new_index: int) -> int:
+        """Помечает для перерисовки только строки старого и нового пунктов меню, возвращает новый индекс"""
+        pitch = self.menu_row_pitch
+        for index in (old_index, new_index):
+            self.invalidate(pygame.Rect(0, Config.SCREEN_HEIGHT // 2 + index * pitch - pitch // 2, Config.SCREEN_WIDTH, pitch))
+        return new_index
+
+    def pop_dirty_rects(self) -> List[pygame.Rect]:
+        dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+        return dirty_rects
 
     def handle_events(self, event: pygame.event.Event) -> None:
         pass
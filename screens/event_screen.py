@@ -2,10 +2,15 @@ import pygame
 from screens.base_screen import BaseScreen
 from game_state import GameState
 from config import Config
+from text_cache import TextCache
+from text_layout import TextLayout
 from typing import Optional, Callable
 
 
 class EventScreen(BaseScreen):
+    # Полупрозрачный оверлей накладывается один раз, а не затемняет кадр все сильнее каждый кадр
+    redraw_every_frame = False
+
     def __init__(self, game):
         super().__init__(game)
         self.event_text = ""
@@ -26,30 +31,14 @@ class EventScreen(BaseScreen):
         overlay.fill((0, 0, 0, 180))
         self.screen.blit(overlay, (0, 0))
 
-        lines = self._wrap_text(self.event_text, Config.SCREEN_WIDTH - 100)
-        for i, line in enumerate(lines):
-            text = self.font.render(line, True, Config.WHITE)
-            text_rect = text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2 + i * 30))
-            self.screen.blit(text, text_rect)
+        paragraph = TextLayout.render_paragraph(self.font, self.event_text, Config.SCREEN_WIDTH - 100, Config.WHITE,
+                                                line_height=30, align="center")
+        # Первая строка центрируется по середине экрана, остальные идут ниже с шагом 30
+        line_height = self.font.get_height()
+        paragraph_rect = paragraph.get_rect(centerx=Config.SCREEN_WIDTH // 2,
+                                            top=Config.SCREEN_HEIGHT // 2 - line_height // 2)
+        self.screen.blit(paragraph, paragraph_rect)
 
-        hint = self.font.render("Нажмите Enter для продолжения...", True, Config.YELLOW)
+        hint = TextCache.render(self.font, "Нажмите Enter для продолжения...", Config.YELLOW)
         hint_rect = hint.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 50))
         self.screen.blit(hint, hint_rect)
-
-    def _wrap_text(self, text: str, max_width: int) -> list:
-        words = text.split(' ')
-        lines = []
-        current_line = []
-
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if self.font.size(test_line)[0] <= max_width:
-                current_line.append(word)
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-
-        if current_line:
-            lines.append(' '.join(current_line))
-
-        return lines
@@ -5,6 +5,8 @@ from config import Config
 
 
 class GameOverScreen(BaseScreen):
+    redraw_every_frame = False
+
     def __init__(self, game):
         super().__init__(game)
         self.options = ["Заново", "Главное меню"]
@@ -17,7 +19,8 @@ class GameOverScreen(BaseScreen):
     def handle_events(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_DOWN or event.key == pygame.K_UP:
-                self.selected_option = (self.selected_option + 1) % len(self.options)
+                self.selected_option = self._select_menu_row(
+                    self.selected_option, (self.selected_option + 1) % len(self.options))
             elif event.key == pygame.K_RETURN:
                 if self.selected_option == 0:
                     self.game.change_state(GameState.GAME)
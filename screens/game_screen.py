@@ -1,6 +1,7 @@
 import pygame
 import math
-from random import randint
+from bisect import insort
+from game_random import GameRandom
 from game_object import Stop
 from event_system import PassengerBoardingEvent, OnRouteEvent, PassengerDisboardingEvent, EventSystem
 from screens.base_screen import BaseScreen
@@ -20,6 +21,7 @@ class GameScreen(BaseScreen):
         self.debug_mode = False
         self.camera = None
         self.dashboard = Dashboard(self.bus)
+        self.visible_objects = []  # Видимые статические объекты в порядке отрисовки, обновляются раз за тик
 
     def on_enter(self, **kwargs) -> None:
         if self.camera is None:
@@ -29,11 +31,15 @@ class GameScreen(BaseScreen):
                 self.game_map.width,
                 self.game_map.height
             )
+            self.camera.update(self.bus)
+        # Первый кадр после входа может быть отрисован раньше первого шага симуляции
+        self.visible_objects = self.game_map.get_sorted_objects(self.camera.camera_rect)
 
     def reset(self):
         """Сброс состояния экрана при новой игре"""
         self.event_system = EventSystem()
         self.camera = None
+        self.visible_objects = []
 
     def handle_events(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -45,12 +51,14 @@ class GameScreen(BaseScreen):
         if self.game.current_state == GameState.PAUSE:
             return
         self.event_system.update(dt)
-        all_entities = self.game_map.get_sorted_objects(self.camera.camera_rect)
-        all_colliders = [entity.collider for entity in all_entities]
-        stops = [entity for entity in all_entities if isinstance(entity, Stop)]
-        self.bus.update(self.game_map.width, self.game_map.height, self.game_map, all_colliders)
+        # Коллайдеры в окрестности нового положения автобус запрашивает у карты сам
+        self.bus.update(self.game_map.width, self.game_map.height, self.game_map)
         self.camera.update(self.bus)
 
+        # Видимые объекты запрашиваются один раз за тик и переиспользуются при отрисовке
+        self.visible_objects = self.game_map.get_sorted_objects(self.camera.camera_rect)
+        stops = [entity for entity in self.visible_objects if isinstance(entity, Stop)]
+
         for entity in stops:
             if entity.active:
                 entity.update(dt)
@@ -64,7 +72,7 @@ class GameScreen(BaseScreen):
                     # Создаем событие посадки пассажиров
                     possible_targets = [stop for stop in self.stops if stop != entity]
                     if possible_targets:
-                        target = possible_targets[randint(0, len(possible_targets)-1)]
+                        target = possible_targets[GameRandom.randint(0, len(possible_targets)-1)]
                         boarding_event = PassengerBoardingEvent(entity, self.bus, target)
 
                         def start_route_event():
@@ -81,14 +89,20 @@ class GameScreen(BaseScreen):
                                                     start_route_event)
 
     def render(self) -> None:
+        # Автобус и камера рисуются между двумя последними шагами симуляции
+        bus_rect = self.bus.get_render_rect(self.interpolation)
+        self.camera.center_on(bus_rect.center)
         self.game_map.draw(self.screen, self.camera)
 
-        all_entities = self.game_map.get_sorted_objects(self.camera.camera_rect)
-        all_entities.append(self.bus)
-        all_entities.sort(key=lambda e: (e.z_order, e.base_y))
+        # Автобус вставляется в уже упорядоченный список без полной пересортировки
+        all_entities = list(self.visible_objects)
+        insort(all_entities, self.bus, key=lambda e: (e.z_order, e.base_y))
 
         for entity in all_entities:
-            self.screen.blit(entity.image, self.camera.apply(entity))
+            if entity is self.bus:
+                self.screen.blit(entity.image, bus_rect.move(self.camera.camera_rect.topleft))
+            else:
+                self.screen.blit(entity.image, self.camera.apply(entity))
 
         self.dashboard.draw(self.screen)
         self.event_system.draw(self.screen)
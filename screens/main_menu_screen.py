@@ -2,21 +2,26 @@ import pygame
 from screens.base_screen import BaseScreen
 from game_state import GameState
 from config import Config
+from fonts import FontRegistry
 
 
 class MainMenuScreen(BaseScreen):
+    redraw_every_frame = False
+
     def __init__(self, game):
         super().__init__(game)
-        self.title_font = pygame.font.SysFont('Monospace Regular', 60)
+        self.title_font = FontRegistry.get(60)
         self.menu_items = ["Начать игру", "Настройки", "Выход"]
         self.selected_item = 0
 
     def handle_events(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_DOWN:
-                self.selected_item = (self.selected_item + 1) % len(self.menu_items)
+                self.selected_item = self._select_menu_row(
+                    self.selected_item, (self.selected_item + 1) % len(self.menu_items))
             elif event.key == pygame.K_UP:
-                self.selected_item = (self.selected_item - 1) % len(self.menu_items)
+                self.selected_item = self._select_menu_row(
+                    self.selected_item, (self.selected_item - 1) % len(self.menu_items))
             elif event.key == pygame.K_RETURN:
                 if self.selected_item == 0:
                     self.game.change_state(GameState.STORY, story_file='story.json')
@@ -5,6 +5,9 @@ from config import Config
 
 
 class PauseScreen(BaseScreen):
+    redraw_every_frame = False
+    menu_row_pitch = 40
+
     def __init__(self, game):
         super().__init__(game)
         self.options = ["Продолжить", "Настройки", "В главное меню"]
@@ -24,9 +27,11 @@ class PauseScreen(BaseScreen):
     def handle_events(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_DOWN:
-                self.selected_option = (self.selected_option + 1) % len(self.options)
+                self.selected_option = self._select_menu_row(
+                    self.selected_option, (self.selected_option + 1) % len(self.options))
             elif event.key == pygame.K_UP:
-                self.selected_option = (self.selected_option - 1) % len(self.options)
+                self.selected_option = self._select_menu_row(
+                    self.selected_option, (self.selected_option - 1) % len(self.options))
             elif event.key == pygame.K_RETURN:
                 if self.selected_option == 0:
                     self.game.change_state(GameState.GAME)
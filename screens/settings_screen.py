@@ -6,6 +6,9 @@ from config import Config
 
 # TODO: реализовать функционал и сохранение настроек в config.json
 class SettingsScreen(BaseScreen):
+    redraw_every_frame = False
+    menu_row_pitch = 40
+
     def __init__(self, game):
         super().__init__(game)
         self.options = ["Громкость музыки", "Громкость звуков", "Управление", "Назад"]
@@ -14,9 +17,11 @@ class SettingsScreen(BaseScreen):
     def handle_events(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_DOWN:
-                self.selected_option = (self.selected_option + 1) % len(self.options)
+                self.selected_option = self._select_menu_row(
+                    self.selected_option, (self.selected_option + 1) % len(self.options))
             elif event.key == pygame.K_UP:
-                self.selected_option = (self.selected_option - 1) % len(self.options)
+                self.selected_option = self._select_menu_row(
+                    self.selected_option, (self.selected_option - 1) % len(self.options))
             elif event.key == pygame.K_RETURN:
                 if self.selected_option == len(self.options) - 1:
                     self.game.change_state(GameState.MAIN_MENU)
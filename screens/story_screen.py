@@ -1,11 +1,17 @@
 import pygame
 import json
+from asset_manager import AssetManager
 from screens.base_screen import BaseScreen
 from game_state import GameState
 from config import Config
+from fonts import FontRegistry
+from preloader import ImagePreloader
+from text_layout import TextLayout
 
 
 class StoryScreen(BaseScreen):
+    redraw_every_frame = False
+
     def __init__(self, game):
         super().__init__(game)
         self.story_data = self._load_story_data()
@@ -16,6 +22,8 @@ class StoryScreen(BaseScreen):
         self.character_position = "left"
         self.text_surface = None
         self.text_rect = None
+        self.slide_cache = {}  # Индекс слайда -> (фон, персонаж, текст, положение текста)
+        self.preloader = None
         self._load_current_slide()
 
     def _load_story_data(self):
@@ -32,76 +40,91 @@ class StoryScreen(BaseScreen):
         if self.current_slide < len(self.story_data["slides"]):
             slide = self.story_data["slides"][self.current_slide]
 
-            # Загрузка фона
+            # Готовые поверхности слайда берутся из кэша, поэтому возврат назад ничего не загружает
+            assets = self.slide_cache.get(self.current_slide)
+            if assets is None:
+                assets = self._build_slide(slide)
+                self.slide_cache[self.current_slide] = assets
+            background, self.character_img, self.text_surface, self.text_rect = assets
+
+            # Слайд без фона оставляет фон предыдущего
             if slide["background"]:
-                try:
-                    self.background = pygame.image.load(slide["background"]).convert()
-                    self.background = pygame.transform.scale(
-                        self.background,
-                        (Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
-                except:
-                    self.background = None
-
-            # Загрузка персонажа
-            if slide["character"]:
-                try:
-                    self.character_img = pygame.image.load(slide["character"]).convert_alpha()
-                    # Масштабируем изображение персонажа
-                    scale_factor = 0.7
-                    orig_width, orig_height = self.character_img.get_size()
-                    new_height = int(Config.SCREEN_HEIGHT * scale_factor)
-                    new_width = int(orig_width * new_height / orig_height)
-                    self.character_img = pygame.transform.scale(
-                        self.character_img,
-                        (new_width, new_height)
-                    )
-                except:
-                    self.character_img = None
-            else:
-                self.character_img = None
+                self.background = background
 
             self.text = slide["text"]
             self.character_position = slide["position"]
 
-            # Создаем поверхность для текста
-            self._create_text_surface()
+            self._preload_next_slides()
+            self.invalidate()
+
+    def _build_slide(self, slide: dict) -> tuple:
+        """Загружает и масштабирует изображения слайда и рендерит его текст"""
+        background = None
+        character_img = None
+
+        # Загрузка фона
+        if slide["background"]:
+            try:
+                background = AssetManager.load_image(
+                    slide["background"],
+                    (Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT),
+                    alpha=False)
+            except:
+                background = None
+
+        # Загрузка персонажа
+        if slide["character"]:
+            try:
+                # Масштабируем изображение персонажа
+                scale_factor = 0.7
+                orig_width, orig_height = AssetManager.load_image(slide["character"]).get_size()
+                new_height = int(Config.SCREEN_HEIGHT * scale_factor)
+                new_width = int(orig_width * new_height / orig_height)
+                character_img = AssetManager.load_image(
+                    slide["character"],
+                    (new_width, new_height)
+                )
+            except:
+                character_img = None
 
-    def _create_text_surface(self):
+        # Создаем поверхность для текста
+        text_surface, text_rect = self._create_text_surface(slide["text"])
+        return background, character_img, text_surface, text_rect
+
+    def _preload_next_slides(self):
+        """Декодирует в фоне изображения следующих слайдов, чтобы переход на них был мгновенным"""
+        if self.preloader is not None and not self.preloader.done:
+            return
+
+        next_slides = self.story_data["slides"][self.current_slide + 1:
+                                                self.current_slide + 1 + Config.STORY_PRELOAD_SLIDES]
+        paths = [slide[key] for slide in next_slides for key in ("background", "character") if slide[key]]
+        preloader = ImagePreloader(paths)
+        if preloader.image_paths:
+            self.preloader = preloader
+            self.preloader.start()
+
+    def _create_text_surface(self, text: str) -> tuple:
         # Рассчитываем размеры текстового блока
         max_width = Config.SCREEN_WIDTH
-        font = pygame.font.SysFont('Monospace Regular', 28)
-
-        # Разбиваем текст на строки
-        words = self.text.split(' ')
-        lines = []
-        current_line = []
+        font = FontRegistry.get(28)
 
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if font.size(test_line)[0] <= max_width:
-                current_line.append(word)
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-
-        if current_line:
-            lines.append(' '.join(current_line))
+        # Разбиваем текст на строки и рендерим его одним абзацем
+        line_height = font.get_linesize()
+        lines = TextLayout.wrap(font, text, max_width)
+        paragraph = TextLayout.render_paragraph(font, text, max_width, Config.WHITE, line_height)
 
         # Создаем поверхность для текста
-        line_height = font.get_linesize()
         text_height = max(len(lines) * line_height + 20, 100)
-        self.text_surface = pygame.Surface((max_width, text_height), pygame.SRCALPHA)
-        self.text_surface.fill((0, 0, 0, 255))  # Полупрозрачный черный фон
-
-        # Рендерим текст
-        for i, line in enumerate(lines):
-            text_render = font.render(line, True, Config.WHITE)
-            self.text_surface.blit(text_render, (10, 10 + i * line_height))
+        text_surface = pygame.Surface((max_width, text_height), pygame.SRCALPHA)
+        text_surface.fill((0, 0, 0, 255))  # Полупрозрачный черный фон
+        text_surface.blit(paragraph, (10, 10))
 
-        self.text_rect = self.text_surface.get_rect(
+        text_rect = text_surface.get_rect(
             center=(Config.SCREEN_WIDTH // 2,
                     Config.SCREEN_HEIGHT - text_height // 2)
         )
+        return text_surface, text_rect
 
     def handle_events(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -160,7 +183,7 @@ class StoryScreen(BaseScreen):
         self.screen.blit(hint, hint_rect)
 
     def on_exit(self) -> None:
-        # Освобождаем ресурсы
+        # Текущие ссылки сбрасываются, а кэш слайдов сохраняется для повторного показа
         self.background = None
         self.character_img = None
         self.text_surface = None
\ No newline at end of file
@@ -0,0 +1,58 @@
+import pygame
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Tuple
+from config import Config
+
+
+class SpatialGrid:
+    """Равномерная сетка для поиска объектов, пересекающих прямоугольную область"""
+
+    def __init__(self, cell_size: int = Config.SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Any]] = defaultdict(list)
+        self.size = 0
+
+    def insert(self, item: Any, rect: pygame.Rect) -> None:
+        """Добавляет объект во все ячейки, которые пересекает его прямоугольник"""
+        self.insert_bounds(item, rect.left, rect.top, rect.right - 1, rect.bottom - 1)
+
+    def insert_bounds(self, item: Any, min_x: float, min_y: float, max_x: float, max_y: float) -> None:
+        """Добавляет объект по границам (включительно), например по AABB коллайдера"""
+        for cell in self._cells_for(min_x, min_y, max_x, max_y):
+            self.cells[cell].append(item)
+        self.size += 1
+
+    def query(self, rect: pygame.Rect) -> List[Any]:
+        """
+        Возвращает объекты из ячеек, пересекающих область.
+
+        Результат может содержать объекты, лишь соседствующие с областью,
+        точную проверку пересечения выполняет вызывающий код.
+        """
+        return self.query_bounds(rect.left, rect.top, rect.right - 1, rect.bottom - 1)
+
+    def query_bounds(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[Any]:
+        found = []
+        seen = set()
+        for cell in self._cells_for(min_x, min_y, max_x, max_y):
+            for item in self.cells.get(cell, ()):
+                if id(item) not in seen:
+                    seen.add(id(item))
+                    found.append(item)
+        return found
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _cells_for(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Iterator[Tuple[int, int]]:
+        first_x = int(min_x // self.cell_size)
+        last_x = int(max(min_x, max_x) // self.cell_size)
+        first_y = int(min_y // self.cell_size)
+        last_y = int(max(min_y, max_y) // self.cell_size)
+        for cx in range(first_x, last_x + 1):
+            for cy in range(first_y, last_y + 1):
+                yield cx, cy
@@ -0,0 +1,125 @@
+import numpy as np
+import pygame
+from collections import OrderedDict
+from typing import Callable, Tuple
+from config import Config
+
+# Цвет самой высокой точки карты, остальные высоты затемняются пропорционально
+TERRAIN_RAMP = np.array([240, 230, 140], dtype=np.float32)
+
+
+def colorize_heightmap(elevation: np.ndarray, block_size: int = 1) -> np.ndarray:
+    """
+    Переводит фрагмент карты высот в массив цветов за одну векторную операцию.
+
+    Args:
+        elevation: Фрагмент нормированных в [0, 1] высот в формате (ширина, высота)
+        block_size: Размер блока, закрашиваемого цветом его левого верхнего пикселя
+
+    Returns:
+        np.ndarray: Массив RGB в формате (ширина, высота, 3), совместимом с pygame.surfarray
+    """
+    width, height = elevation.shape
+    if block_size > 1:
+        elevation = elevation[::block_size, ::block_size]
+
+    rgb = (elevation[..., np.newaxis] * TERRAIN_RAMP).astype(np.uint8)
+
+    if block_size > 1:
+        rgb = rgb.repeat(block_size, axis=0).repeat(block_size, axis=1)[:width, :height]
+    return rgb
+
+
+def render_heightmap(elevation: np.ndarray, block_size: int = 1) -> pygame.Surface:
+    """Отрисовывает фрагмент нормированных высот в новую поверхность"""
+    return pygame.surfarray.make_surface(colorize_heightmap(elevation, block_size))
+
+
+class TerrainChunkCache:
+    """LRU-кэш отрисованных фрагментов (чанков) ландшафта"""
+
+    def __init__(self, render_chunk: Callable[[pygame.Rect], pygame.Surface],
+                 map_width: int, map_height: int,
+                 chunk_size: int = Config.TERRAIN_CHUNK_SIZE,
+                 budget: int = Config.TERRAIN_CACHE_BUDGET):
+        """
+        Args:
+            render_chunk: Функция отрисовки области карты (в мировых координатах) в поверхность
+            map_width: Ширина карты в пикселях
+            map_height: Высота карты в пикселях
+            chunk_size: Размер стороны чанка в пикселях
+            budget: Максимальный объем памяти под кэш в байтах
+        """
+        self.render_chunk = render_chunk
+        self.map_width = map_width
+        self.map_height = map_height
+        self.chunk_size = chunk_size
+        self.budget = budget
+        self.chunks: OrderedDict[Tuple[int, int], pygame.Surface] = OrderedDict()
+        self.memory_used = 0
+
+    def get_chunk(self, cx: int, cy: int) -> pygame.Surface:
+        """Возвращает чанк по его индексу, отрисовывая его при отсутствии в кэше"""
+        key = (cx, cy)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+
+        chunk = self.render_chunk(self.chunk_rect(cx, cy))
+        self.chunks[key] = chunk
+        self.memory_used += self._surface_bytes(chunk)
+        self._evict()
+        return chunk
+
+    def chunk_rect(self, cx: int, cy: int) -> pygame.Rect:
+        """Область карты, покрываемая чанком (крайние чанки обрезаются границей карты)"""
+        x = cx * self.chunk_size
+        y = cy * self.chunk_size
+        return pygame.Rect(
+            x, y,
+            min(self.chunk_size, self.map_width - x),
+            min(self.chunk_size, self.map_height - y)
+        )
+
+    def draw(self, surface: pygame.Surface, area: pygame.Rect, offset: Tuple[int, int]) -> None:
+        """
+        Отрисовывает на поверхности все чанки, пересекающие область карты.
+
+        Args:
+            surface: Поверхность для отрисовки
+            area: Область карты в мировых координатах
+            offset: Смещение мировых координат относительно поверхности
+        """
+        area = area.clip(pygame.Rect(0, 0, self.map_width, self.map_height))
+        if area.width <= 0 or area.height <= 0:
+            return
+
+        first_cx = area.left // self.chunk_size
+        last_cx = (area.right - 1) // self.chunk_size
+        first_cy = area.top // self.chunk_size
+        last_cy = (area.bottom - 1) // self.chunk_size
+
+        for cx in range(first_cx, last_cx + 1):
+            for cy in range(first_cy, last_cy + 1):
+                chunk_rect = self.chunk_rect(cx, cy)
+                visible = chunk_rect.clip(area)
+                surface.blit(
+                    self.get_chunk(cx, cy),
+                    (visible.x + offset[0], visible.y + offset[1]),
+                    visible.move(-chunk_rect.x, -chunk_rect.y)
+                )
+
+    def clear(self) -> None:
+        self.chunks.clear()
+        self.memory_used = 0
+
+    def _evict(self) -> None:
+        """Вытесняет давно не использованные чанки при превышении бюджета памяти"""
+        while self.memory_used > self.budget and len(self.chunks) > 1:
+            _, chunk = self.chunks.popitem(last=False)
+            self.memory_used -= self._surface_bytes(chunk)
+
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
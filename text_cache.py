@@ -0,0 +1,35 @@
+import pygame
+from collections import OrderedDict
+from typing import Tuple
+from config import Config
+
+
+class TextCache:
+    """
+    LRU-кэш отрисованных строк, общий для всего интерфейса.
+
+    Строка растеризуется заново, только когда меняется отображаемый текст. Возвращаемые
+    поверхности разделяются между вызовами, поэтому изменять их нельзя.
+    """
+
+    _surfaces: OrderedDict[Tuple[pygame.font.Font, str, tuple, bool], pygame.Surface] = OrderedDict()
+    max_size = Config.TEXT_CACHE_SIZE
+
+    @classmethod
+    def render(cls, font: pygame.font.Font, text: str, color: tuple, antialias: bool = True) -> pygame.Surface:
+        """Аналог font.render(text, antialias, color) с кэшированием результата"""
+        key = (font, text, tuple(color), antialias)
+        surface = cls._surfaces.get(key)
+        if surface is not None:
+            cls._surfaces.move_to_end(key)
+            return surface
+
+        surface = font.render(text, antialias, color)
+        cls._surfaces[key] = surface
+        if len(cls._surfaces) > cls.max_size:
+            cls._surfaces.popitem(last=False)
+        return surface
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._surfaces.clear()
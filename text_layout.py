@@ -0,0 +1,114 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from config import Config
+
+
+class TextLayout:
+    """
+    Разбиение текста на строки по ширине и отрисовка абзацев с кэшированием.
+
+    Ширина каждого слова измеряется один раз, а ширина строки набирается суммой ширин слов
+    и пробелов, поэтому перенос выполняется за линейное время. Готовые разбиения и
+    отрисованные абзацы хранятся в LRU-кэшах и разделяются между вызовами - изменять
+    возвращаемые поверхности нельзя.
+    """
+
+    _word_widths: Dict[Tuple[pygame.font.Font, str], int] = {}
+    _layouts: OrderedDict[Tuple[str, pygame.font.Font, int], List[str]] = OrderedDict()
+    _paragraphs: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+    max_size = Config.TEXT_LAYOUT_CACHE_SIZE
+
+    @classmethod
+    def wrap(cls, font: pygame.font.Font, text: str, max_width: int) -> List[str]:
+        """
+        Жадно разбивает текст на строки не шире max_width.
+
+        Слово, которое само не помещается в строку, занимает отдельную строку целиком.
+        """
+        key = (text, font, max_width)
+        lines = cls._layouts.get(key)
+        if lines is not None:
+            cls._layouts.move_to_end(key)
+            return lines
+
+        space_width = cls._measure(font, ' ')
+        lines = []
+        current_line = []
+        current_width = 0
+
+        for word in text.split(' '):
+            word_width = cls._measure(font, word)
+            if not current_line:
+                current_line.append(word)
+                current_width = word_width
+            elif current_width + space_width + word_width <= max_width:
+                current_line.append(word)
+                current_width += space_width + word_width
+            else:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+                current_width = word_width
+
+        if current_line:
+            lines.append(' '.join(current_line))
+
+        cls._store(cls._layouts, key, lines)
+        return lines
+
+    @classmethod
+    def render_paragraph(cls, font: pygame.font.Font, text: str, max_width: int, color: tuple,
+                         line_height: Optional[int] = None, align: str = "left") -> pygame.Surface:
+        """
+        Возвращает прозрачную поверхность шириной max_width с перенесенным текстом.
+
+        Args:
+            font: Шрифт текста
+            text: Текст абзаца
+            max_width: Ширина абзаца в пикселях
+            color: Цвет текста
+            line_height: Шаг между строками, None - font.get_linesize()
+            align: Выравнивание строк: "left" или "center"
+        """
+        if line_height is None:
+            line_height = font.get_linesize()
+        key = (font, text, max_width, tuple(color), line_height, align)
+        surface = cls._paragraphs.get(key)
+        if surface is not None:
+            cls._paragraphs.move_to_end(key)
+            return surface
+
+        line_surfaces = [font.render(line, True, color) for line in cls.wrap(font, text, max_width)]
+        height = max(i * line_height + line.get_height() for i, line in enumerate(line_surfaces))
+        surface = pygame.Surface((max_width, height), pygame.SRCALPHA)
+        for i, line_surface in enumerate(line_surfaces):
+            line_rect = line_surface.get_rect(top=i * line_height)
+            if align == "center":
+                line_rect.centerx = max_width // 2
+            # Строки не перекрываются, поэтому MAX просто копирует пиксели вместе с альфа-каналом,
+            # и абзац выглядит так же, как построчная отрисовка прямо на экран
+            surface.blit(line_surface, line_rect, special_flags=pygame.BLEND_RGBA_MAX)
+
+        cls._store(cls._paragraphs, key, surface)
+        return surface
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._word_widths.clear()
+        cls._layouts.clear()
+        cls._paragraphs.clear()
+
+    @classmethod
+    def _measure(cls, font: pygame.font.Font, word: str) -> int:
+        key = (font, word)
+        width = cls._word_widths.get(key)
+        if width is None:
+            width = font.size(word)[0]
+            cls._word_widths[key] = width
+        return width
+
+    @classmethod
+    def _store(cls, cache: OrderedDict, key, value) -> None:
+        cache[key] = value
+        if len(cache) > cls.max_size:
+            cache.popitem(last=False)
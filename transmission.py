@@ -1,6 +1,6 @@
 import math
 from enum import Enum, auto
-from random import randint
+from game_random import GameRandom
 from typing import Optional
 
 ratios = {
@@ -198,7 +198,7 @@ class Transmission:
             cooling_factor = 1
             self.temperature = (self.temperature + heating_factor - cooling_factor)
 
-            if self.temperature > (110 + randint(-20, 20) / 10):
+            if self.temperature > (110 + GameRandom.randint(-20, 20) / 10):
                 self.stall()
 
     class Clutch: